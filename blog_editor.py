@@ -1,12 +1,16 @@
 import sys
 import os
+import re
 import json
 import shutil
 import tempfile
 import hashlib
+import secrets
+import threading
 from datetime import datetime
-import markdown
-from PIL import Image
+from pathlib import Path
+from collections import OrderedDict
+from functools import lru_cache, partial
 import io
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -15,23 +19,331 @@ from PySide6.QtWidgets import (
     QTextBrowser, QFrame, QSplitter, QScrollArea, QToolBar, QMenu,
     QFontComboBox, QSpinBox, QProgressDialog, QMessageBox
 )
-from PySide6.QtCore import Qt, QDate, QLocale, QPropertyAnimation, QEasingCurve, QSize, QMimeData, QUrl, QTimer, QBuffer
+from PySide6.QtCore import (
+    Qt, QDate, QLocale, QPropertyAnimation, QEasingCurve, QSize, QMimeData, QUrl, QTimer, QBuffer,
+    QThreadPool, QRunnable, QObject, Signal, Slot, QEvent
+)
 from PySide6.QtGui import (
     QColor, QFont, QIcon, QPalette, QDragEnterEvent, QDropEvent,
     QTextCharFormat, QSyntaxHighlighter, QTextCursor, QKeySequence,
-    QAction
+    QAction, QImage
 )
 
-from config_manager import ConfigManager
+from config_manager import ConfigManager, _json_dumps, _json_loads
 from error_handler import ErrorHandler, handle_errors
 from image_processor import ImageProcessor
-from file_manager import FileManager
+from file_manager import FileManager, _yaml_backend
+
+try:
+    # 可选依赖 google-re2：线性时间匹配，不会因回溯退化
+    import re2 as _highlight_re
+except ImportError:
+    _highlight_re = re
+
+# 字数统计用的正则：连续的中文字符、英文单词
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]+')
+_WORD_RE = re.compile(r'[A-Za-z]+\w*')
+
+# Markdown 图片引用，分组为图片路径
+_IMG_RE = re.compile(r'!\[[^\]]*\]\(([^)]+)\)')
+
+# 列表项开头，以及引用式链接、脚注、缩写的定义行（分块渲染时使用）
+_LIST_ITEM_RE = re.compile(r'\s*(?:[*+-]|\d+\.)\s')
+_REF_DEF_RE = re.compile(r'^ {0,3}\*?\[[^\]]+\]:', re.M)
+# 围栏代码块的开始行，分组为围栏字符串（至少三个 ` 或 ~，与 fenced_code 扩展一样必须顶格）
+_FENCE_RE = re.compile(r'(`{3,}|~{3,})')
+# 行首的原始 HTML 块（块内允许空行），以及 ATX 标题
+_HTML_BLOCK_RE = re.compile(r'^ {0,3}<[A-Za-z!?/]', re.M)
+_HEADER_RE = re.compile(r'^ {0,3}#{1,6}[ \t]+(.*?)[ \t#]*$', re.M)
+
+# 路径分隔符不是 / 的平台（Windows）生成 file:/// URL 时需要替换
+_NEEDS_SEP_REPLACE = os.sep != '/'
+
+# 粘贴、拖放图片的临时目录，跨会话复用；编辑器写入和启动时的过期清理必须使用同一目录
+_TEMP_DIR = os.path.join(os.path.expanduser("~"), ".blog_editor", "tmp")
+
+
+def _count_words(text):
+    """统计文本中的中文字数和英文单词数"""
+    # 中文按连续片段匹配再累加长度，比逐字匹配少分配大量单字符对象
+    chinese_count = sum(map(len, _CJK_RE.findall(text)))
+    english_words = len(_WORD_RE.findall(text))
+    return chinese_count, english_words
+
+
+@lru_cache(maxsize=None)
+def _markdown_renderer(use_markdown_it=False):
+    """返回 Markdown 渲染函数，首次调用时才导入渲染库
+    
+    markdown-it-py 的分词器比 python-markdown 快得多，但不支持 toc、
+    codehilite、脚注等扩展，输出不同，因此只在配置 use_markdown_it 开启时使用。
+    """
+    MarkdownIt = None
+    if use_markdown_it:
+        try:
+            # 可选依赖 markdown-it-py
+            from markdown_it import MarkdownIt
+        except ImportError:
+            pass
+    if MarkdownIt is None:
+        import markdown
+        # 只创建一次 Markdown 实例，扩展的初始化不必在每次渲染时重复
+        md = markdown.Markdown(
+            extensions=[
+                'markdown.extensions.extra',
+                'markdown.extensions.codehilite',
+                'markdown.extensions.tables',
+                'markdown.extensions.toc',
+                'markdown.extensions.fenced_code',
+                'markdown.extensions.nl2br'
+            ]
+        )
+        
+        def convert(text):
+            # reset 清除上一篇文档的状态（脚注、目录等）
+            return md.reset().convert(text)
+        return convert
+    # breaks 对应 nl2br，表格和删除线对应 extra/tables
+    md = MarkdownIt("commonmark", {"html": True, "breaks": True})
+    md.enable(["table", "strikethrough"])
+    return md.render
+
+
+def _markdown_to_html(text, use_markdown_it=False):
+    """将 Markdown 文本渲染为 HTML"""
+    return _markdown_renderer(use_markdown_it)(text)
+
+
+def _split_markdown_blocks(text):
+    """按空行把 Markdown 切分为可以独立渲染的块
+    
+    围栏代码块内部不切分（与 fenced_code 扩展一致，结束围栏必须顶格且与开始围栏完全相同，
+    只允许尾随空格）；
+    缩进的续行、连续的列表项和引用、定义列表的定义行并入上一个块，
+    保证列表、代码、引用等跨空行的结构仍然作为整体渲染。
+    """
+    blocks = []
+    current = []
+    fence = None
+    for line in text.split('\n'):
+        stripped = line.lstrip()
+        if fence:
+            # 围栏代码块内的所有行（包括空行）都属于当前块
+            current.append(line)
+            if line.rstrip(' ') == fence:
+                fence = None
+            continue
+        if not stripped:
+            if current:
+                blocks.append(current)
+                current = []
+            continue
+        if not current and blocks and (
+            line[0] in ' \t' or
+            stripped[0] == ':' or
+            (stripped[0] == '>' and blocks[-1][-1].lstrip().startswith('>')) or
+            (_LIST_ITEM_RE.match(line) and any(map(_LIST_ITEM_RE.match, blocks[-1])))
+        ):
+            # 空行之后的续行：恢复上一个块并保留空行
+            current = blocks.pop()
+            current.append('')
+        match = _FENCE_RE.match(line)
+        if match:
+            fence = match.group(1)
+        current.append(line)
+    if current:
+        blocks.append(current)
+    return ['\n'.join(block) for block in blocks]
+
+
+@lru_cache(maxsize=256)
+def _render_markdown_block(block, use_markdown_it=False):
+    """渲染单个 Markdown 块，未修改的块直接复用缓存结果"""
+    return _markdown_to_html(block, use_markdown_it)
+
+
+def _has_duplicate_header_ids(text):
+    """标题生成的锚点 id 是否重复（toc 扩展在整篇文档内为重复的 id 添加后缀）"""
+    titles = _HEADER_RE.findall(text)
+    if len(titles) < 2:
+        return False
+    try:
+        from markdown.extensions.toc import slugify
+    except ImportError:
+        return False
+    ids = [slugify(title, '-') for title in titles]
+    return len(set(ids)) != len(ids)
+
+
+@lru_cache(maxsize=16)
+def _render_markdown(text, use_markdown_it=False):
+    """将 Markdown 文本渲染为 HTML，相同文本直接返回缓存结果"""
+    # 引用式链接、脚注、缩写、目录、原始 HTML 块和重复的标题锚点
+    # 需要看到整篇文档，只能整体渲染
+    if ('[TOC]' in text or _REF_DEF_RE.search(text) or
+            _HTML_BLOCK_RE.search(text) or _has_duplicate_header_ids(text)):
+        return _markdown_to_html(text, use_markdown_it)
+    # 逐块渲染：输入时通常只有一个块发生变化，其余块命中缓存
+    return '\n'.join(_render_markdown_block(block, use_markdown_it)
+                     for block in _split_markdown_blocks(text))
+
+
+@lru_cache(maxsize=256)
+def _image_url(base_path, path):
+    """将图片路径转换为预览使用的 URL，每次输入都会重复转换相同的路径，结果缓存"""
+    if path.startswith(('http://', 'https://', 'file:///')):
+        return path
+    
+    # 处理相对路径
+    if path.startswith(('./', '../')):
+        abs_path = os.path.normpath(os.path.join(base_path, path))
+    else:
+        # 处理本地路径
+        abs_path = os.path.abspath(path)
+    
+    # 转换为 file:/// URL
+    if _NEEDS_SEP_REPLACE:
+        abs_path = abs_path.replace(os.sep, '/')
+    return f'file:///{abs_path}'
+
+
+# 将 QTextCursor.selectedText() 的结果转换为与 toPlainText() 相同的字符
+_PLAIN_TEXT_TABLE = str.maketrans({
+    '\u2029': '\n', '\u2028': '\n', '\ufdd0': '\n', '\ufdd1': '\n', '\u00a0': ' ',
+})
+
+
+def _is_word_char(ch):
+    """判断字符是否属于单词（与正则中的 \\w 一致）"""
+    return ch.isalnum() or ch == '_'
+
+
+class BackgroundWriter:
+    """后台文件写入线程，调用方提交后立即返回；同一路径只写入最新提交的内容，
+    同一时间只有一个写入在进行"""
+    def __init__(self):
+        self._pending = {}  # 路径 -> (待写入的字节数据, 完成回调)
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, path, data, callback=None):
+        """提交写入任务
+        
+        callback(success) 在写入线程中调用；同一路径的旧任务被新任务覆盖时不会调用旧回调
+        """
+        with self._condition:
+            self._pending[path] = (data, callback)
+            self._condition.notify_all()
+
+    def flush(self):
+        """等待所有已提交的写入完成"""
+        with self._condition:
+            while self._pending or self._busy:
+                self._condition.wait()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                path = next(iter(self._pending))
+                data, callback = self._pending.pop(path)
+                self._busy = True
+            success = False
+            # 先写入临时文件再替换，写入中途退出也不会留下不完整的文件
+            tmp_path = path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+                success = True
+            except Exception as e:
+                print(f"后台写入文件失败: {str(e)}")
+                # 写入或替换失败时删除临时文件
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            if callback is not None:
+                try:
+                    callback(success)
+                except Exception as e:
+                    print(f"写入回调执行失败: {str(e)}")
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+# 全局共享的后台写入线程
+background_writer = BackgroundWriter()
+
+class CompressedImageCache:
+    """图片压缩结果缓存，按图片内容哈希复用已压缩的图片"""
+    def __init__(self):
+        self.cache_dir = os.path.join(tempfile.gettempdir(), "blog_editor_images")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache_size = 50  # 最大缓存图片数
+
+    def get_cache_key(self, data, *params):
+        """根据图片内容和压缩参数生成缓存键"""
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return '_'.join([digest, *map(str, params)])
+
+    def load(self, cache_key, output_path):
+        """缓存命中时把压缩结果复制到目标路径，返回是否命中"""
+        cache_file = os.path.join(self.cache_dir, cache_key + '.img')
+        try:
+            shutil.copyfile(cache_file, output_path)
+            # 更新修改时间，清理时按最近使用保留
+            os.utime(cache_file)
+            return True
+        except OSError:
+            return False
+
+    def save(self, cache_key, data):
+        """保存压缩后的图片数据"""
+        try:
+            cache_file = os.path.join(self.cache_dir, cache_key + '.img')
+            # 先写入临时文件再替换，避免多个线程同时写入同一个缓存文件
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+                f.write(data)
+            os.replace(f.name, cache_file)
+            
+            # 清理旧缓存
+            self._cleanup_old_cache()
+        except Exception as e:
+            print(f"保存图片缓存失败: {str(e)}")
+
+    def _cleanup_old_cache(self):
+        """清理最久未使用的缓存图片"""
+        try:
+            # scandir 的目录项自带文件类型和 stat 信息，减少系统调用
+            with os.scandir(self.cache_dir) as entries:
+                files = [(entry.path, entry.stat().st_mtime) for entry in entries
+                         if entry.name.endswith('.img') and entry.is_file()]
+            
+            # 数量未超出限制时无需排序
+            if len(files) <= self.cache_size:
+                return
+            
+            # 按修改时间排序
+            files.sort(key=lambda x: x[1], reverse=True)
+            
+            # 删除旧文件
+            for path, _ in files[self.cache_size:]:
+                os.remove(path)
+        except Exception as e:
+            print(f"清理图片缓存失败: {str(e)}")
 
 class ImageCompressor:
     def __init__(self):
         self.max_size = (1920, 1080)  # 最大分辨率
         self.quality = 85  # JPEG压缩质量
         self.max_file_size = 500 * 1024  # 最大文件大小（500KB）
+        self.cache = CompressedImageCache()  # 压缩结果缓存
 
     def compress_image(self, input_path, output_path):
         """压缩图片，返回是否进行了压缩"""
@@ -42,41 +354,204 @@ class ImageCompressor:
                     shutil.copy2(input_path, output_path)
                 return False
 
-            img = Image.open(input_path)
+            with open(input_path, 'rb') as f:
+                raw = f.read()
             
-            # 转换为RGB模式（处理PNG等格式）
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            
-            # 调整大小
-            if img.size[0] > self.max_size[0] or img.size[1] > self.max_size[1]:
-                img.thumbnail(self.max_size, Image.Resampling.LANCZOS)
+            # 相同的图片已经压缩过时直接复用结果
+            cache_key = self.cache.get_cache_key(raw, *self._params())
+            if self.cache.load(cache_key, output_path):
+                return True
+
+            # Image.open 只读取文件头，像素在真正需要时才解码
+            from PIL import Image  # 延迟导入，首次处理图片时才加载 PIL
+            with Image.open(io.BytesIO(raw)) as img:
+                data = self._save_compressed(img, output_path)
+            self.cache.save(cache_key, data)
+            return True
+        except Exception as e:
+            print(f"图片压缩失败: {str(e)}")
+            if input_path != output_path:
+                shutil.copy2(input_path, output_path)
+            return False
+
+    def compress_qimage(self, image, output_path):
+        """压缩 QImage（剪贴板图片），像素直接在内存中交给 PIL，返回是否进行了压缩"""
+        try:
+            # 先在内存中编码为 PNG，不超过大小限制时原样保存（保留透明度），不进行压缩
+            buffer = QBuffer()
+            buffer.open(QBuffer.WriteOnly)
+            image.save(buffer, "PNG")
+            png = bytes(buffer.data())
+            if len(png) <= self.max_file_size:
+                with open(output_path, 'wb') as f:
+                    f.write(png)
+                return False
             
-            # 保存压缩后的图片
-            img.save(output_path, 'JPEG', quality=self.quality, optimize=True)
+            rgba = image.convertToFormat(QImage.Format_RGBA8888)
+            pixels = bytes(rgba.constBits())
+            size = (rgba.width(), rgba.height())
             
-            # 如果文件仍然太大，继续降低质量
-            while os.path.getsize(output_path) > self.max_file_size and self.quality > 30:
-                self.quality -= 5
-                img.save(output_path, 'JPEG', quality=self.quality, optimize=True)
+            # 相同的图片已经压缩过时直接复用结果
+            cache_key = self.cache.get_cache_key(pixels, f"{size[0]}x{size[1]}", *self._params())
+            if self.cache.load(cache_key, output_path):
+                return True
             
+            from PIL import Image  # 延迟导入，首次处理图片时才加载 PIL
+            img = Image.frombuffer('RGBA', size, pixels, 'raw', 'RGBA', rgba.bytesPerLine(), 1)
+            data = self._save_compressed(img, output_path)
+            self.cache.save(cache_key, data)
             return True
         except Exception as e:
             print(f"图片压缩失败: {str(e)}")
-            if input_path != output_path:
-                shutil.copy2(input_path, output_path)
+            image.save(output_path)
             return False
 
+    def _params(self):
+        """影响压缩结果的参数，作为缓存键的一部分"""
+        return (self.quality, f"{self.max_size[0]}x{self.max_size[1]}", self.max_file_size)
+
+    def _save_compressed(self, img, output_path):
+        """缩放并压缩图片后保存，返回保存的字节数据"""
+        # 颜色数不超过 256 的图片（截图、图表等）适合调色板 PNG，照片不需要检查
+        palette_friendly = img.format != 'JPEG' and img.getcolors(maxcolors=256) is not None
+        
+        # 调整大小（尺寸来自文件头，已在范围内时不缩放）
+        width, height = img.size
+        if width > self.max_size[0] or height > self.max_size[1]:
+            from PIL import Image
+            img.thumbnail(self.max_size, Image.Resampling.LANCZOS)
+        
+        data = self._encode_png(img) if palette_friendly else None
+        if data is None or len(data) > self.max_file_size:
+            data = self._compress_jpeg(img)
+        
+        # 只把最终结果写入磁盘
+        with open(output_path, 'wb') as f:
+            f.write(data)
+        return data
+
+    def _compress_jpeg(self, img):
+        """将图片压缩为 JPEG，文件仍然过大时降低质量，返回字节数据"""
+        # 转换为RGB模式（处理PNG等格式）
+        if img.mode in ('RGBA', 'P'):
+            img = img.convert('RGB')
+        
+        # 质量只使用局部变量，不修改实例属性，保证每张图片都从相同的默认质量开始
+        start_quality = self.quality
+        
+        # 先按默认质量编码，大多数图片到这里就满足要求
+        data = self._encode_jpeg(img, start_quality)
+        
+        # 如果文件仍然太大，二分查找不超过大小限制的最高质量（文件大小随质量单调变化）
+        if len(data) > self.max_file_size:
+            low, high = 30, start_quality - 1
+            best = None
+            while low <= high:
+                quality = (low + high) // 2
+                candidate = self._encode_jpeg(img, quality)
+                if len(candidate) <= self.max_file_size:
+                    best = candidate
+                    low = quality + 1
+                else:
+                    high = quality - 1
+                    if best is None:
+                        data = candidate  # 都超出限制时保留质量最低的结果
+            if best is not None:
+                data = best
+        return data
+
+    def _encode_png(self, img):
+        """在内存中将图片量化为调色板 PNG，返回字节数据"""
+        if img.mode != 'P':
+            img = img.convert('RGBA').quantize(colors=256)
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG', optimize=True, compress_level=9)
+        return buffer.getvalue()
+
+    def _encode_jpeg(self, img, quality):
+        """在内存中将图片编码为 JPEG，返回字节数据"""
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True)
+        return buffer.getvalue()
+
+class ImageJobSignals(QObject):
+    """图片压缩任务的信号（QRunnable 不是 QObject，不能直接定义信号）"""
+    finished = Signal(int, str, bool)  # 序号, 处理后的图片路径（失败为空）, 是否进行了压缩
+
+class ImageJob(QRunnable):
+    """在线程池中压缩一张拖放的图片文件或粘贴的 QImage"""
+    def __init__(self, compressor, index, source, output_path):
+        super().__init__()
+        self.signals = ImageJobSignals()
+        self.compressor = compressor
+        self.index = index
+        self.source = source  # 图片文件路径或 QImage
+        self.output_path = output_path
+
+    def run(self):
+        try:
+            if isinstance(self.source, QImage):
+                # 剪贴板图片的像素直接在内存中压缩（QImage 可以在非界面线程中使用）
+                was_compressed = self.compressor.compress_qimage(self.source, self.output_path)
+            else:
+                # 直接从原图压缩到目标路径；不需要压缩时 compress_image 会自行复制原图
+                was_compressed = self.compressor.compress_image(self.source, self.output_path)
+            self.signals.finished.emit(self.index, self.output_path, was_compressed)
+        except Exception as e:
+            print(f"处理图片失败: {str(e)}")
+            self.signals.finished.emit(self.index, "", False)
+
+class ImageDropBatch(QObject):
+    """一次拖放的图片批次，在界面线程中收集压缩结果并按拖放顺序插入"""
+    def __init__(self, editor, progress, count):
+        super().__init__(editor)
+        self.editor = editor
+        self.progress = progress
+        self.results = [None] * count
+        self.next_index = 0
+        self.finished_count = 0
+
+    @Slot(int, str, bool)
+    def on_job_finished(self, index, image_path, was_compressed):
+        self.finished_count += 1
+        if self.finished_count == len(self.results):
+            self.deleteLater()
+        if self.progress.wasCanceled():
+            return
+        self.progress.setValue(self.finished_count)
+        
+        self.results[index] = (image_path, was_compressed)
+        while self.next_index < len(self.results) and self.results[self.next_index] is not None:
+            image_path, was_compressed = self.results[self.next_index]
+            if image_path:
+                self.editor.insert_image_markdown(image_path, was_compressed)
+            self.next_index += 1
+
 class DragDropTextEdit(QTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)   
-        self.temp_dir = tempfile.mkdtemp()  # 创建临时目录
+        # 固定的临时目录跨会话复用：自动保存恢复的文章仍能引用上次插入的图片，
+        # 过期文件由 BlogEditor 启动时清理
+        self.temp_dir = _TEMP_DIR
+        os.makedirs(self.temp_dir, exist_ok=True)
         self.image_paths = []  # 存储所有使用的图片路径
         self.image_compressor = ImageCompressor()  # 创建图片压缩器实例
+        # 拖放和粘贴图片的压缩线程池，取消时只清空本编辑器的任务
+        self._image_pool = QThreadPool(self)
+        self._image_pool.setMaxThreadCount(os.cpu_count() or 1)
         self.word_count = 0
         self.read_time = 0
-        self.textChanged.connect(self.update_statistics)
+        # 增量统计状态：上一次统计时的文本及中英文计数
+        self._stats_text = ""
+        self._chinese_count = 0
+        self._english_words = 0
+        # 状态栏刷新防抖：连续输入时只在停顿后刷新一次
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(250)
+        self._stats_timer.timeout.connect(self._show_statistics)
+        self.document().contentsChange.connect(self._on_contents_change)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         mime_data = event.mimeData()
@@ -86,52 +561,59 @@ class DragDropTextEdit(QTextEdit):
     def dropEvent(self, event: QDropEvent):
         mime_data = event.mimeData()
         if mime_data.hasUrls():
-            progress = QProgressDialog("正在处理图片...", "取消", 0, len(mime_data.urls()), self)
-            progress.setWindowTitle("处理中")
-            progress.setWindowModality(Qt.WindowModal)
-            
-            for i, url in enumerate(mime_data.urls()):
-                if progress.wasCanceled():
-                    break
-                    
-                progress.setValue(i)
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-                    self.process_image(file_path)
+            file_paths = [url.toLocalFile() for url in mime_data.urls()
+                          if url.toLocalFile().lower().endswith(('.png', '.jpg', '.jpeg', '.gif'))]
+            if file_paths:
+                progress = QProgressDialog("正在处理图片...", "取消", 0, len(file_paths), self)
+                progress.setWindowTitle("处理中")
+                progress.setWindowModality(Qt.WindowModal)
+                progress.setValue(0)
+                
+                # 图片在线程池中并行压缩，完成后在界面线程按拖放顺序插入
+                batch = ImageDropBatch(self, progress, len(file_paths))
+                progress.canceled.connect(self._image_pool.clear)
+                progress.canceled.connect(batch.deleteLater)
+                for index, file_path in enumerate(file_paths):
+                    job = ImageJob(self.image_compressor, index, file_path, self._new_temp_path(".png"))
+                    job.signals.finished.connect(batch.on_job_finished)
+                    self._image_pool.start(job)
                         
-            progress.setValue(len(mime_data.urls()))
             event.acceptProposedAction()
 
-    def process_image(self, image_path, image_data=None):
-        """处理图片，支持文件路径或图片数据"""
+    def _new_temp_path(self, ext):
+        """生成唯一的临时图片路径"""
+        # 临时目录跨会话共享，使用随机文件名避免覆盖以前插入的图片
+        temp_filename = f"image_{secrets.token_hex(8)}{ext}"
+        return os.path.join(self.temp_dir, temp_filename)
+
+    def process_image(self, qimage):
+        """在线程池中压缩剪贴板中的 QImage，完成后在界面线程插入图片引用"""
         try:
-            # 生成唯一的临时文件名
-            temp_filename = f"image_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
-            temp_image_path = os.path.join(self.temp_dir, temp_filename)
-            
-            if image_data:  # 处理剪贴板图片数据
-                with open(temp_image_path, 'wb') as f:
-                    f.write(image_data)
-            else:  # 处理文件路径
-                shutil.copy2(image_path, temp_image_path)
-            
-            # 压缩图片
-            was_compressed = self.image_compressor.compress_image(temp_image_path, temp_image_path)
-            self.image_paths.append(temp_image_path)
-            
-            # 插入 Markdown 图片语法
-            cursor = self.textCursor()
-            cursor.insertText(f"\n![{os.path.basename(temp_image_path)}]({temp_image_path})")
-            if was_compressed:
-                cursor.insertText(" *(已优化)*\n")
-            else:
-                cursor.insertText("\n")
-                
+            job = ImageJob(self.image_compressor, 0, qimage, self._new_temp_path(".png"))
+            job.signals.finished.connect(self._on_paste_finished)
+            self._image_pool.start(job)
             return True
         except Exception as e:
             print(f"处理图片失败: {str(e)}")
             return False
 
+    @Slot(int, str, bool)
+    def _on_paste_finished(self, index, image_path, was_compressed):
+        """粘贴的图片压缩完成"""
+        if image_path:
+            self.insert_image_markdown(image_path, was_compressed)
+
+    def insert_image_markdown(self, image_path, was_compressed):
+        """在光标处插入图片的 Markdown 语法"""
+        self.image_paths.append(image_path)
+        
+        cursor = self.textCursor()
+        cursor.insertText(f"\n![{os.path.basename(image_path)}]({image_path})")
+        if was_compressed:
+            cursor.insertText(" *(已优化)*\n")
+        else:
+            cursor.insertText("\n")
+
     def keyPressEvent(self, event):
         # 处理粘贴操作
         if event.key() == Qt.Key_V and event.modifiers() == Qt.ControlModifier:
@@ -142,14 +624,8 @@ class DragDropTextEdit(QTextEdit):
                 # 从剪贴板获取图片
                 image = clipboard.image()
                 if not image.isNull():
-                    # 将 QImage 转换为字节数据
-                    buffer = QBuffer()
-                    buffer.open(QBuffer.ReadWrite)
-                    image.save(buffer, "PNG")
-                    image_data = buffer.data().data()
-                    
                     # 处理图片
-                    if self.process_image(None, image_data):
+                    if self.process_image(image):
                         return
             
             # 如果不是图片或处理失败，执行默认的粘贴操作
@@ -158,19 +634,73 @@ class DragDropTextEdit(QTextEdit):
             super().keyPressEvent(event)
 
     def cleanup(self):
-        """清理临时目录"""
-        try:
-            shutil.rmtree(self.temp_dir)
-        except:
-            pass
+        """等待尚未完成的图片压缩任务
+        
+        临时目录跨会话共享，关闭时不删除，其中的图片可能仍被自动保存的内容引用
+        """
+        self._image_pool.clear()
+        self._image_pool.waitForDone()
 
     def update_statistics(self):
-        """更新字数统计和阅读时间"""
-        text = self.toPlainText()
+        """全量更新字数统计和阅读时间"""
+        text = self.document().toPlainText()
+        self._stats_text = text
         
         # 计算字数（中英文分别计算）
-        chinese_count = len([c for c in text if '\u4e00' <= c <= '\u9fff'])
-        english_words = len([w for w in text.split() if any(c.isalpha() for c in w)])
+        self._chinese_count, self._english_words = _count_words(text)
+        
+        self._show_statistics()
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """根据文档的增量变化更新字数统计，只扫描被修改的片段"""
+        old_text = self._stats_text
+        document = self.document()
+        new_length = document.characterCount() - 1  # 不含文档末尾的段落分隔符
+        
+        # 变化范围超出文本或与文本长度对不上时（如 setPlainText，或文本中有 emoji 等
+        # 占两个 UTF-16 单元的字符）退回全量统计
+        if (position + chars_removed > len(old_text) or position + chars_added > new_length or
+                len(old_text) - chars_removed + chars_added != new_length):
+            self.update_statistics()
+            return
+        
+        # 只从文档中取出新增的片段，拼接到上一次的文本中，不必把整个文档转换为字符串
+        added = ""
+        if chars_added:
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + chars_added, QTextCursor.KeepAnchor)
+            added = cursor.selectedText().translate(_PLAIN_TEXT_TABLE)
+            if len(added) != chars_added:
+                # 包含 UTF-16 代理对的字符（如 emoji）时位置与字符串下标不一致
+                self.update_statistics()
+                return
+        new_text = old_text[:position] + added + old_text[position + chars_removed:]
+        self._stats_text = new_text
+        
+        # 向两侧扩展到单词边界，保证被修改的单词完整参与统计
+        start = min(position, len(old_text))
+        while start > 0 and _is_word_char(old_text[start - 1]):
+            start -= 1
+        old_end = min(position + chars_removed, len(old_text))
+        new_end = old_end - chars_removed + chars_added
+        while old_end < len(old_text) and _is_word_char(old_text[old_end]):
+            old_end += 1
+            new_end += 1
+        
+        old_chinese, old_english = _count_words(old_text[start:old_end])
+        new_chinese, new_english = _count_words(new_text[start:new_end])
+        self._chinese_count += new_chinese - old_chinese
+        self._english_words += new_english - old_english
+        
+        self._stats_timer.start()
+
+    def _show_statistics(self):
+        """根据当前计数刷新字数和阅读时间显示"""
+        # 立即刷新时取消尚未触发的防抖刷新
+        self._stats_timer.stop()
+        chinese_count = self._chinese_count
+        english_words = self._english_words
         
         self.word_count = chinese_count + english_words
         
@@ -214,9 +744,28 @@ class StyledFrame(QFrame):
         """)
 
 class MarkdownHighlighter(QSyntaxHighlighter):
+    # 预编译的高亮规则（正则, 格式名），按顺序应用
+    # 行内代码和链接先于粗体、斜体扫描，落在它们之中的粗体、斜体标记不生效
+    _PATTERNS = [
+        # 标题
+        (_highlight_re.compile(r"^#{1,6}\s.*$"), "header"),
+        # 行内代码
+        (_highlight_re.compile(r"`.*?`"), "code"),
+        # 链接
+        (_highlight_re.compile(r"\[.*?\]\(.*?\)"), "link"),
+        # 粗体
+        (_highlight_re.compile(r"\*\*.*?\*\*"), "bold"),
+        (_highlight_re.compile(r"__.*?__"), "bold"),
+        # 斜体
+        (_highlight_re.compile(r"\*.*?\*"), "italic"),
+        (_highlight_re.compile(r"_.*?_"), "italic"),
+    ]
+    _CACHE_SIZE = 4096  # 行级高亮缓存的最大条目数
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.formats = {}
+        self._block_cache = OrderedDict()  # 行文本 -> 格式区间列表
         
         # 标题格式
         header_format = QTextCharFormat()
@@ -251,103 +800,33 @@ class MarkdownHighlighter(QSyntaxHighlighter):
         self.formats["link"] = link_format
 
     def highlightBlock(self, text):
-        # 标题
-        for i in range(6, 0, -1):
-            pattern = f"^{'#' * i}\\s.*$"
-            self.highlight_pattern(text, pattern, self.formats["header"])
-        
-        # 粗体
-        self.highlight_pattern(text, r"\*\*.*?\*\*", self.formats["bold"])
-        self.highlight_pattern(text, r"__.*?__", self.formats["bold"])
-        
-        # 斜体
-        self.highlight_pattern(text, r"\*.*?\*", self.formats["italic"])
-        self.highlight_pattern(text, r"_.*?_", self.formats["italic"])
-        
-        # 行内代码
-        self.highlight_pattern(text, r"`.*?`", self.formats["code"])
-        
-        # 链接
-        self.highlight_pattern(text, r"\[.*?\]\(.*?\)", self.formats["link"])
-
-    def highlight_pattern(self, text, pattern, format):
-        import re
-        for match in re.finditer(pattern, text):
-            start, end = match.span()
-            self.setFormat(start, end - start, format)
-
-class TextCache:
-    def __init__(self):
-        self.cache_dir = os.path.join(tempfile.gettempdir(), "blog_editor_cache")
-        os.makedirs(self.cache_dir, exist_ok=True)
-        self.cache_size = 10  # 最大缓存文件数
-        self.chunk_size = 50000  # 每个分块的字符数
-        
-    def get_cache_key(self, text):
-        """生成缓存键"""
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
-        
-    def save_to_cache(self, text):
-        """将文本保存到缓存"""
-        try:
-            cache_key = self.get_cache_key(text)
-            cache_file = os.path.join(self.cache_dir, cache_key)
-            
-            # 分块保存
-            chunks = [text[i:i + self.chunk_size] 
-                     for i in range(0, len(text), self.chunk_size)]
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'chunks': chunks,
-                    'timestamp': datetime.now().timestamp()
-                }, f)
-                
-            # 清理旧缓存
-            self._cleanup_old_cache()
-            
-            return cache_key
-        except Exception as e:
-            print(f"保存缓存失败: {str(e)}")
-            return None
-            
-    def load_from_cache(self, cache_key):
-        """从缓存加载文本"""
-        try:
-            cache_file = os.path.join(self.cache_dir, cache_key)
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return ''.join(data['chunks'])
-        except Exception as e:
-            print(f"加载缓存失败: {str(e)}")
-        return None
-        
-    def _cleanup_old_cache(self):
-        """清理旧的缓存文件"""
-        try:
-            files = []
-            for f in os.listdir(self.cache_dir):
-                path = os.path.join(self.cache_dir, f)
-                if os.path.isfile(path):
-                    files.append((path, os.path.getmtime(path)))
-            
-            # 按修改时间排序
-            files.sort(key=lambda x: x[1], reverse=True)
-            
-            # 删除旧文件
-            for path, _ in files[self.cache_size:]:
-                os.remove(path)
-        except Exception as e:
-            print(f"清理缓存失败: {str(e)}")
-            
-    def cleanup(self):
-        """清理所有缓存"""
-        try:
-            if os.path.exists(self.cache_dir):
-                shutil.rmtree(self.cache_dir)
-        except Exception as e:
-            print(f"清理缓存失败: {str(e)}")
+        # 行内容未变化时直接复用缓存的格式区间，避免重复执行正则
+        spans = self._block_cache.get(text)
+        if spans is None:
+            spans = self._collect_spans(text)
+            self._block_cache[text] = spans
+            if len(self._block_cache) > self._CACHE_SIZE:
+                self._block_cache.popitem(last=False)
+        else:
+            self._block_cache.move_to_end(text)
+
+        for start, length, key in spans:
+            self.setFormat(start, length, self.formats[key])
+
+    def _collect_spans(self, text):
+        """计算一行文本需要应用的格式区间 [(起始位置, 长度, 格式名)]"""
+        spans = []
+        protected = []  # 行内代码和链接的区间
+        for pattern, key in self._PATTERNS:
+            for match in pattern.finditer(text):
+                start, end = match.span()
+                if key in ("code", "link"):
+                    protected.append((start, end))
+                elif key in ("bold", "italic") and any(
+                        start < p_end and p_start < end for p_start, p_end in protected):
+                    continue
+                spans.append((start, end - start, key))
+        return spans
 
 class MarkdownEditor(DragDropTextEdit):
     def __init__(self, parent=None):
@@ -356,8 +835,6 @@ class MarkdownEditor(DragDropTextEdit):
         self.setup_toolbar()
         self.setup_status_bar()
         self.highlighter = MarkdownHighlighter(self.document())
-        self.text_cache = TextCache()
-        self.current_cache_key = None
         self.word_count = 0
         self.read_time = 0
 
@@ -427,43 +904,6 @@ class MarkdownEditor(DragDropTextEdit):
         """)
         self.status_bar.show()
 
-    def update_statistics(self):
-        """更新字数统计和阅读时间"""
-        text = self.toPlainText()
-        
-        # 计算字数（中英文分别计算）
-        chinese_count = len([c for c in text if '\u4e00' <= c <= '\u9fff'])
-        english_words = len([w for w in text.split() if any(c.isalpha() for c in w)])
-        
-        self.word_count = chinese_count + english_words
-        
-        # 估算阅读时间（假设中文每分钟300字，英文每分钟200词）
-        chinese_time = chinese_count / 300
-        english_time = english_words / 200
-        self.read_time = chinese_time + english_time
-        
-        # 更新状态栏标签
-        if hasattr(self, 'word_count_label'):
-            self.word_count_label.setText(f"字数：{self.word_count}")
-            
-            if self.read_time < 1:
-                time_text = "< 1 分钟"
-            else:
-                minutes = int(self.read_time)
-                if minutes == 0:
-                    time_text = "< 1 分钟"
-                elif minutes < 60:
-                    time_text = f"{minutes} 分钟"
-                else:
-                    hours = minutes // 60
-                    remaining_minutes = minutes % 60
-                    if remaining_minutes == 0:
-                        time_text = f"{hours} 小时"
-                    else:
-                        time_text = f"{hours} 小时 {remaining_minutes} 分钟"
-            
-            self.read_time_label.setText(f"预计阅读时间：{time_text}")
-
     def setup_toolbar(self):
         self.toolbar = QToolBar()
         self.toolbar.setIconSize(QSize(16, 16))
@@ -727,9 +1167,9 @@ class MarkdownEditor(DragDropTextEdit):
                 if content.startswith('---'):
                     # 提取 frontmatter
                     _, frontmatter, content = content.split('---', 2)
-                    import yaml
+                    yaml, loader, _ = _yaml_backend()
                     try:
-                        metadata = yaml.safe_load(frontmatter)
+                        metadata = yaml.load(frontmatter, Loader=loader)
                         # 发送信号给父窗口更新元数据
                         if hasattr(self.parent(), 'update_metadata'):
                             self.parent().update_metadata(metadata)
@@ -751,21 +1191,11 @@ class MarkdownEditor(DragDropTextEdit):
                 print(f"导入失败: {str(e)}")
 
     def setPlainText(self, text):
-        """重写setPlainText方法，添加缓存支持"""
-        # 保存到缓存
-        self.current_cache_key = self.text_cache.save_to_cache(text)
+        """重写setPlainText方法，设置文本后更新统计"""
         super().setPlainText(text)
         # 手动触发统计更新
         self.update_statistics()
 
-    def toPlainText(self):
-        """重写toPlainText方法，优先从缓存读取"""
-        if self.current_cache_key:
-            cached_text = self.text_cache.load_from_cache(self.current_cache_key)
-            if cached_text is not None:
-                return cached_text
-        return super().toPlainText()
-
     def resizeEvent(self, event):
         """处理窗口大小调整事件"""
         super().resizeEvent(event)
@@ -779,48 +1209,87 @@ class AutoSaver:
     def __init__(self, editor):
         self.editor = editor
         self.auto_save_interval = 60000  # 60秒
-        self.last_content = ""
-        self.last_metadata = {}
+        self._last_save_digest = None  # 上一次保存的内容和元数据的哈希值
         self.auto_save_dir = os.path.join(tempfile.gettempdir(), "blog_editor_autosave")
         os.makedirs(self.auto_save_dir, exist_ok=True)
+        # 内容和元数据合并保存在同一个文件中，每次自动保存只写一个文件
+        self.state_file = os.path.join(self.auto_save_dir, "state.json")
+        
+        # 变化标记：内容和元数据的版本号未变化时跳过自动保存
+        # （不能使用 QTextDocument.revision()，setPlainText 之后修订号总是相同）
+        self._version = 0
+        self._saved_version = -1
+        self._saved_extras = None
+        for signal in (
+            editor.content_input.document().contentsChanged,
+            editor.title_input.textChanged,
+            editor.desc_input.textChanged,
+            editor.folder_input.textChanged,
+            editor.date_input.dateChanged,
+            editor.lang_select.currentIndexChanged,
+            editor.tags_list.model().rowsInserted,
+            editor.tags_list.model().rowsRemoved,
+        ):
+            signal.connect(self._mark_changed)
         
         # 创建自动保存计时器
         self.timer = QTimer()
         self.timer.timeout.connect(self.auto_save)
         self.timer.start(self.auto_save_interval)
         
+    def _mark_changed(self, *args):
+        """内容或元数据控件发生变化"""
+        self._version += 1
+
+    def _on_state_written(self, digest, success):
+        """状态文件写入完成（在后台写入线程中调用，只修改普通属性）"""
+        if success:
+            self._last_save_digest = digest
+        else:
+            # 写入失败：清除版本标记，下一个周期即使内容未变化也会重试
+            self._saved_version = -1
+
     def auto_save(self):
         """自动保存当前内容和元数据"""
         try:
-            current_content = self.editor.content_input.toPlainText()
-            current_metadata = {
-                "title": self.editor.title_input.text(),
-                "description": self.editor.desc_input.toPlainText(),
-                "folder": self.editor.folder_input.text(),
-                "date": self.editor.date_input.date().toString("yyyy-MM-dd"),
-                "tags": [self.editor.tags_list.item(i).text() 
-                        for i in range(self.editor.tags_list.count())],
-                "language": self.editor.lang_select.currentText(),
-                "color": self.editor.current_color,
-                "image_path": self.editor.image_path
-            }
+            # 颜色和封面图片没有对应的信号，直接比较
+            version = self._version
+            extras = (self.editor.current_color, self.editor.image_path)
+            if version == self._saved_version and extras == self._saved_extras:
+                return
             
-            # 只在内容或元数据发生变化时保存
-            if (current_content != self.last_content or 
-                current_metadata != self.last_metadata):
-                
-                # 保存内容
-                content_file = os.path.join(self.auto_save_dir, "content.md")
-                with open(content_file, "w", encoding="utf-8") as f:
-                    f.write(current_content)
-                
-                # 保存元数据
-                metadata_file = os.path.join(self.auto_save_dir, "metadata.json")
-                with open(metadata_file, "w", encoding="utf-8") as f:
-                    json.dump(current_metadata, f, ensure_ascii=False, indent=2)
+            editor = self.editor
+            current_content = editor.content_input.toPlainText()
+            title = editor.title_input.text()
+            description = editor.desc_input.toPlainText()
+            folder = editor.folder_input.text()
+            date = editor.date_input.date().toString("yyyy-MM-dd")
+            tags = tuple(editor.tags_list.item(i).text() for i in range(editor.tags_list.count()))
+            language = editor.lang_select.currentText()
+            
+            # 只在内容或元数据发生变化时保存：比较哈希值，不保留上一次的完整内容
+            digest = hash((current_content, title, description, folder, date, tags,
+                           language, editor.current_color, editor.image_path))
+            # 先记录已处理的版本，写入失败的回调会将其清除以便重试
+            self._saved_version = version
+            self._saved_extras = extras
+            if digest != self._last_save_digest:
+                current_metadata = {
+                    "title": title,
+                    "description": description,
+                    "folder": folder,
+                    "date": date,
+                    "tags": list(tags),
+                    "language": language,
+                    "color": editor.current_color,
+                    "image_path": editor.image_path
+                }
                 
-                self.last_content = current_content
-                self.last_metadata = current_metadata
+                # 保存内容和元数据（文件由后台线程写入，写入成功后才记录哈希值）
+                background_writer.write(self.state_file, _json_dumps({
+                    "content": current_content,
+                    "metadata": current_metadata
+                }), partial(self._on_state_written, digest))
                 
                 # 更新状态栏
                 self.editor.statusBar().showMessage("已自动保存", 2000)
@@ -846,20 +1315,12 @@ class AutoSaver:
     def try_restore(self):
         """尝试恢复上次的自动保存内容"""
         try:
-            content_file = os.path.join(self.auto_save_dir, "content.md")
-            metadata_file = os.path.join(self.auto_save_dir, "metadata.json")
+            state = _json_loads(Path(self.state_file).read_bytes())
             
-            if os.path.exists(content_file) and os.path.exists(metadata_file):
-                # 读取内容
-                with open(content_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                # 读取元数据
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
-                
-                return content, metadata
-                
+            return state["content"], state["metadata"]
+            
+        except FileNotFoundError:
+            pass  # 没有自动保存的内容
         except Exception as e:
             print(f"恢复自动保存失败: {str(e)}")
         
@@ -868,12 +1329,402 @@ class AutoSaver:
     def cleanup(self):
         """清理自动保存文件"""
         try:
-            if os.path.exists(self.auto_save_dir):
-                shutil.rmtree(self.auto_save_dir)
+            background_writer.flush()
+            # 只删除状态文件，保留自动保存目录供下次使用
+            os.remove(self.state_file)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"清理自动保存失败: {str(e)}")
 
+# 主窗口样式
+_MAIN_QSS = """
+QMainWindow {
+    background-color: #f5f5f5;
+}
+QLabel {
+    font-size: 13px;
+    color: #333;
+    margin-bottom: 4px;
+}
+QLabel#imagePathLabel {
+    color: #666;
+}
+QLabel#imagePathLabel[selected="true"] {
+    color: #2ecc71;
+}
+QLineEdit, QTextEdit, QDateEdit, QComboBox {
+    padding: 8px 12px;
+    border: 1px solid #e0e0e0;
+    border-radius: 6px;
+    background-color: white;
+    min-height: 20px;
+    font-size: 13px;
+    color: #2c3e50;
+}
+QLineEdit:focus, QTextEdit:focus, QDateEdit:focus, QComboBox:focus {
+    border: 2px solid #4a90e2;
+    outline: none;
+}
+QLineEdit:hover, QTextEdit:hover, QDateEdit:hover, QComboBox:hover {
+    border: 1px solid #4a90e2;
+}
+QDateEdit::drop-down, QComboBox::drop-down {
+    border: none;
+    width: 20px;
+}
+QDateEdit::down-arrow, QComboBox::down-arrow {
+    image: none;
+    border: solid 5px transparent;
+    border-top: solid 5px #666;
+    margin-right: 5px;
+}
+QListWidget {
+    border: 1px solid #e0e0e0;
+    border-radius: 6px;
+    background-color: white;
+    padding: 5px;
+    outline: none;  /* 移除焦点轮廓 */
+}
+QListWidget::item {
+    padding: 5px;
+    border-radius: 4px;
+    margin: 2px 0;
+}
+QListWidget::item:selected {
+    background-color: #e3f2fd;
+    color: #1976d2;
+    border: none;  /* 移除选中边框 */
+}
+QListWidget::item:hover {
+    background-color: #f5f5f5;
+}
+QListWidget:focus {
+    border: 1px solid #4a90e2;  /* 列表获得焦点时的边框样式 */
+    outline: none;  /* 移除默认的焦点轮廓 */
+}
+QPushButton {
+    padding: 8px 16px;
+    background-color: #4a90e2;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-size: 13px;
+    min-width: 80px;
+    font-weight: 500;
+}
+QPushButton:hover {
+    background-color: #357abd;
+}
+QPushButton:pressed {
+    background-color: #2a5d8c;
+}
+QPushButton#deleteButton {
+    background-color: #dc3545;
+}
+QPushButton#deleteButton:hover {
+    background-color: #c82333;
+}
+QPushButton#addButton {
+    background-color: #28a745;
+}
+QPushButton#addButton:hover {
+    background-color: #218838;
+}
+QScrollArea {
+    border: none;
+    background-color: transparent;
+}
+QSplitter::handle {
+    background-color: #ddd;
+    margin: 2px;
+}
+StyledFrame {
+    background-color: white;
+    border-radius: 10px;
+    border: 1px solid #e0e0e0;
+}
+QTextEdit#contentEdit {
+    font-family: "Consolas", "Microsoft YaHei", monospace;
+    font-size: 14px;
+    line-height: 1.5;
+    background-color: #ffffff;
+    color: #2c3e50;
+    border: none;
+}
+QTextBrowser#preview {
+    font-family: "Microsoft YaHei", Arial, sans-serif;
+    font-size: 14px;
+    line-height: 1.6;
+    background-color: #ffffff;
+    padding: 20px;
+    border: none;
+}
+"""
+
+# 颜色预览块样式，{color} 为当前选择的颜色
+_COLOR_PREVIEW_QSS = "background-color: {color}; border: 1px solid #ddd; border-radius: 4px;"
+
+# 日期选择框样式
+_DATE_QSS = """
+QDateEdit {
+    padding: 8px 35px 8px 12px;
+    border: 1px solid #e0e0e0;
+    border-radius: 6px;
+    background-color: white;
+    min-height: 20px;
+    font-size: 13px;
+    color: #2c3e50;
+}
+QDateEdit:focus {
+    border: 2px solid #4a90e2;
+    outline: none;
+}
+QDateEdit:hover {
+    border: 1px solid #4a90e2;
+}
+QDateEdit::drop-down {
+    width: 25px;
+    border: none;
+    border-left: 1px solid #e0e0e0;
+    background: transparent;
+}
+QDateEdit::down-arrow {
+    width: 16px;
+    height: 16px;
+    margin-right: 5px;
+    background: transparent;
+    border: none;
+    image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='16' height='16' viewBox='0 0 24 24'%3E%3Cpath fill='%23666666' d='M19 3h-1V1h-2v2H8V1H6v2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm0 16H5V8h14v11zM7 10h5v5H7z'/%3E%3C/svg%3E");
+}
+QDateEdit::down-arrow:hover {
+    image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='16' height='16' viewBox='0 0 24 24'%3E%3Cpath fill='%234a90e2' d='M19 3h-1V1h-2v2H8V1H6v2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm0 16H5V8h14v11zM7 10h5v5H7z'/%3E%3C/svg%3E");
+}
+"""
+
+# 日历弹出框样式
+_CALENDAR_QSS = """
+QCalendarWidget {
+    background-color: white;
+    border: 1px solid #e0e0e0;
+    border-radius: 8px;
+}
+QCalendarWidget QToolButton {
+    color: #333333;
+    padding: 6px;
+    border: none;
+    border-radius: 4px;
+    font-size: 13px;
+    min-width: 60px;
+    min-height: 25px;
+}
+QCalendarWidget QToolButton:hover {
+    background-color: #e3f2fd;
+    color: #1976d2;
+}
+QCalendarWidget QMenu {
+    background-color: white;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    padding: 4px;
+}
+QCalendarWidget QMenu::item:selected {
+    background-color: #e3f2fd;
+    color: #1976d2;
+}
+QCalendarWidget QSpinBox {
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    padding: 3px;
+    margin: 0 2px;
+    font-size: 13px;
+}
+QCalendarWidget QSpinBox::up-button, QCalendarWidget QSpinBox::down-button {
+    border: none;
+    background: #f5f5f5;
+    border-radius: 2px;
+}
+QCalendarWidget QWidget#qt_calendar_navigationbar {
+    background-color: #ffffff;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+    border-bottom: 1px solid #e0e0e0;
+    padding: 6px;
+}
+QCalendarWidget QWidget { 
+    alternate-background-color: #fafafa;
+}
+QCalendarWidget QAbstractItemView:enabled {
+    color: #333333;
+    selection-background-color: #e3f2fd;
+    selection-color: #1976d2;
+    font-size: 13px;
+}
+QCalendarWidget QAbstractItemView:disabled {
+    color: #bbbbbb;
+}
+QCalendarWidget QTableView {
+    outline: 0;
+    selection-background-color: #e3f2fd;
+}
+QCalendarWidget QTableView QHeaderView {
+    background-color: white;
+}
+QCalendarWidget QTableView QHeaderView::section {
+    color: #666666;
+    padding: 6px;
+    border: none;
+    font-size: 12px;
+    font-weight: bold;
+    background-color: transparent;
+}
+QCalendarWidget QTableView QAbstractItemView:enabled #qt_calendar_daywidget[today="true"] {
+    color: #1976d2;
+    font-weight: bold;
+    background-color: #e3f2fd;
+    border-radius: 4px;
+}
+QCalendarWidget QTableView QAbstractItemView:enabled #qt_calendar_daywidget[selected="true"] {
+    color: white;
+    font-weight: bold;
+    background-color: #1976d2;
+    border-radius: 4px;
+}
+QCalendarWidget QTableView QAbstractItemView:enabled #qt_calendar_daywidget[weekend="true"] {
+    color: #e57373;
+}
+"""
+
+# 预览页面的 HTML 头部（含样式）和尾部，渲染时只替换中间的正文
+_PREVIEW_HTML_PREFIX = """\
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+    body {
+        font-family: "Microsoft YaHei", Arial, sans-serif;
+        line-height: 1.6;
+        color: #2c3e50;
+        max-width: 100%;
+        padding: 20px 40px;
+        margin: 0;
+        box-sizing: border-box;
+    }
+    h1, h2, h3, h4, h5, h6 {
+        color: #34495e;
+        margin-top: 24px;
+        margin-bottom: 16px;
+        line-height: 1.25;
+    }
+    h1 { font-size: 2em; border-bottom: 1px solid #eee; padding-bottom: .3em; }
+    h2 { font-size: 1.5em; border-bottom: 1px solid #eee; padding-bottom: .3em; }
+    p { margin: 16px 0; line-height: 1.8; }
+    img {
+        max-width: 600px;  /* 设置固定的最大宽度 */
+        max-height: 400px;  /* 设置固定的最大高度 */
+        width: auto;  /* 保持宽高比 */
+        height: auto;  /* 保持宽高比 */
+        object-fit: contain;  /* 确保图片完整显示 */
+        border-radius: 4px;
+        margin: 20px auto;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        display: block;
+    }
+    code {
+        background-color: #f8f9fa;
+        padding: 2px 4px;
+        border-radius: 3px;
+        font-family: Consolas, monospace;
+        font-size: 0.9em;
+        color: #e83e8c;
+    }
+    pre {
+        background-color: #f8f9fa;
+        padding: 16px;
+        border-radius: 4px;
+        overflow-x: auto;
+        line-height: 1.45;
+        border: 1px solid #e1e4e8;
+    }
+    pre code {
+        background-color: transparent;
+        padding: 0;
+        color: #24292e;
+        white-space: pre;
+    }
+    blockquote {
+        padding: 0.5em 1em;
+        color: #6a737d;
+        border-left: 0.25em solid #dfe2e5;
+        margin: 16px 0;
+        background-color: #f6f8fa;
+    }
+    table {
+        border-collapse: collapse;
+        width: 100%;
+        margin: 16px 0;
+        display: block;
+        overflow-x: auto;
+    }
+    table th, table td {
+        border: 1px solid #dfe2e5;
+        padding: 8px 13px;
+    }
+    table th {
+        background-color: #f6f8fa;
+        font-weight: 600;
+    }
+    table tr:nth-child(2n) {
+        background-color: #f8f9fa;
+    }
+    a {
+        color: #0366d6;
+        text-decoration: none;
+    }
+    a:hover {
+        text-decoration: underline;
+        color: #0056b3;
+    }
+    ul, ol {
+        padding-left: 2em;
+        margin: 16px 0;
+    }
+    li {
+        margin: 4px 0;
+    }
+    hr {
+        height: 1px;
+        background-color: #e1e4e8;
+        border: none;
+        margin: 24px 0;
+    }
+    kbd {
+        background-color: #fafbfc;
+        border: 1px solid #d1d5da;
+        border-bottom-color: #c6cbd1;
+        border-radius: 3px;
+        box-shadow: inset 0 -1px 0 #c6cbd1;
+        color: #444d56;
+        display: inline-block;
+        font-size: 0.9em;
+        line-height: 1;
+        padding: 3px 5px;
+    }
+</style>
+</head>
+<body>
+"""
+_PREVIEW_HTML_SUFFIX = """
+</body>
+</html>
+"""
+
 class BlogEditor(QMainWindow):
+    _PREVIEW_CACHE_SIZE = 4  # 预览渲染结果缓存的最大条目数
+    # 匹配 Markdown 图片语法，分组为替代文本和图片路径
+    _PREVIEW_IMG_RE = re.compile(r'!\[(.*?)\]\((.*?)\)')
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("博客编辑器")
@@ -889,13 +1740,18 @@ class BlogEditor(QMainWindow):
         self.image_processor = ImageProcessor(self.config_manager)
         self.file_manager = FileManager(self.config_manager)
         
-        # 设置临时目录
-        self.temp_dir = tempfile.mkdtemp()
+        # 设置临时目录：固定目录跨会话复用，启动时只清理过期的临时文件
+        self.temp_dir = _TEMP_DIR
         self.image_processor.setup_temp_dir(self.temp_dir)
+        self._clean_stale_temp_files()
         
         # 从配置加载保存路径
         self.save_path = self.config_manager.get('save_path', '')
         
+        self._preview_cache = OrderedDict()  # 内容哈希 -> 渲染后的 HTML
+        self._preview_search_path = None  # 预览控件当前的资源搜索路径
+        self._preview_dirty = False  # 预览隐藏期间内容是否有变化
+        
         # 设置中文环境
         QLocale.setDefault(QLocale(QLocale.Chinese, QLocale.China))
         
@@ -912,123 +1768,7 @@ class BlogEditor(QMainWindow):
     def _init_ui(self):
         """初始化用户界面"""
         # 设置应用样式
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QLabel {
-                font-size: 13px;
-                color: #333;
-                margin-bottom: 4px;
-            }
-            QLineEdit, QTextEdit, QDateEdit, QComboBox {
-                padding: 8px 12px;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                background-color: white;
-                min-height: 20px;
-                font-size: 13px;
-                color: #2c3e50;
-            }
-            QLineEdit:focus, QTextEdit:focus, QDateEdit:focus, QComboBox:focus {
-                border: 2px solid #4a90e2;
-                outline: none;
-            }
-            QLineEdit:hover, QTextEdit:hover, QDateEdit:hover, QComboBox:hover {
-                border: 1px solid #4a90e2;
-            }
-            QDateEdit::drop-down, QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QDateEdit::down-arrow, QComboBox::down-arrow {
-                image: none;
-                border: solid 5px transparent;
-                border-top: solid 5px #666;
-                margin-right: 5px;
-            }
-            QListWidget {
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                background-color: white;
-                padding: 5px;
-                outline: none;  /* 移除焦点轮廓 */
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-radius: 4px;
-                margin: 2px 0;
-            }
-            QListWidget::item:selected {
-                background-color: #e3f2fd;
-                color: #1976d2;
-                border: none;  /* 移除选中边框 */
-            }
-            QListWidget::item:hover {
-                background-color: #f5f5f5;
-            }
-            QListWidget:focus {
-                border: 1px solid #4a90e2;  /* 列表获得焦点时的边框样式 */
-                outline: none;  /* 移除默认的焦点轮廓 */
-            }
-            QPushButton {
-                padding: 8px 16px;
-                background-color: #4a90e2;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 13px;
-                min-width: 80px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #357abd;
-            }
-            QPushButton:pressed {
-                background-color: #2a5d8c;
-            }
-            QPushButton#deleteButton {
-                background-color: #dc3545;
-            }
-            QPushButton#deleteButton:hover {
-                background-color: #c82333;
-            }
-            QPushButton#addButton {
-                background-color: #28a745;
-            }
-            QPushButton#addButton:hover {
-                background-color: #218838;
-            }
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QSplitter::handle {
-                background-color: #ddd;
-                margin: 2px;
-            }
-            StyledFrame {
-                background-color: white;
-                border-radius: 10px;
-                border: 1px solid #e0e0e0;
-            }
-            QTextEdit#contentEdit {
-                font-family: "Consolas", "Microsoft YaHei", monospace;
-                font-size: 14px;
-                line-height: 1.5;
-                background-color: #ffffff;
-                color: #2c3e50;
-                border: none;
-            }
-            QTextBrowser#preview {
-                font-family: "Microsoft YaHei", Arial, sans-serif;
-                font-size: 14px;
-                line-height: 1.6;
-                background-color: #ffffff;
-                padding: 20px;
-                border: none;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
         
         # 创建主窗口部件和布局
         main_widget = QWidget()
@@ -1073,134 +1813,10 @@ class BlogEditor(QMainWindow):
         self.date_input.setDate(QDate.currentDate())
         self.date_input.setCalendarPopup(True)
         # 设置日期选择框样式
-        self.date_input.setStyleSheet("""
-            QDateEdit {
-                padding: 8px 35px 8px 12px;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                background-color: white;
-                min-height: 20px;
-                font-size: 13px;
-                color: #2c3e50;
-            }
-            QDateEdit:focus {
-                border: 2px solid #4a90e2;
-                outline: none;
-            }
-            QDateEdit:hover {
-                border: 1px solid #4a90e2;
-            }
-            QDateEdit::drop-down {
-                width: 25px;
-                border: none;
-                border-left: 1px solid #e0e0e0;
-                background: transparent;
-            }
-            QDateEdit::down-arrow {
-                width: 16px;
-                height: 16px;
-                margin-right: 5px;
-                background: transparent;
-                border: none;
-                image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='16' height='16' viewBox='0 0 24 24'%3E%3Cpath fill='%23666666' d='M19 3h-1V1h-2v2H8V1H6v2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm0 16H5V8h14v11zM7 10h5v5H7z'/%3E%3C/svg%3E");
-            }
-            QDateEdit::down-arrow:hover {
-                image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='16' height='16' viewBox='0 0 24 24'%3E%3Cpath fill='%234a90e2' d='M19 3h-1V1h-2v2H8V1H6v2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm0 16H5V8h14v11zM7 10h5v5H7z'/%3E%3C/svg%3E");
-            }
-        """)
+        self.date_input.setStyleSheet(_DATE_QSS)
         
         # 设置日历弹出框样式
-        self.date_input.calendarWidget().setStyleSheet("""
-            QCalendarWidget {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-            }
-            QCalendarWidget QToolButton {
-                color: #333333;
-                padding: 6px;
-                border: none;
-                border-radius: 4px;
-                font-size: 13px;
-                min-width: 60px;
-                min-height: 25px;
-            }
-            QCalendarWidget QToolButton:hover {
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-            QCalendarWidget QMenu {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QCalendarWidget QMenu::item:selected {
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-            QCalendarWidget QSpinBox {
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                padding: 3px;
-                margin: 0 2px;
-                font-size: 13px;
-            }
-            QCalendarWidget QSpinBox::up-button, QCalendarWidget QSpinBox::down-button {
-                border: none;
-                background: #f5f5f5;
-                border-radius: 2px;
-            }
-            QCalendarWidget QWidget#qt_calendar_navigationbar {
-                background-color: #ffffff;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                border-bottom: 1px solid #e0e0e0;
-                padding: 6px;
-            }
-            QCalendarWidget QWidget { 
-                alternate-background-color: #fafafa;
-            }
-            QCalendarWidget QAbstractItemView:enabled {
-                color: #333333;
-                selection-background-color: #e3f2fd;
-                selection-color: #1976d2;
-                font-size: 13px;
-            }
-            QCalendarWidget QAbstractItemView:disabled {
-                color: #bbbbbb;
-            }
-            QCalendarWidget QTableView {
-                outline: 0;
-                selection-background-color: #e3f2fd;
-            }
-            QCalendarWidget QTableView QHeaderView {
-                background-color: white;
-            }
-            QCalendarWidget QTableView QHeaderView::section {
-                color: #666666;
-                padding: 6px;
-                border: none;
-                font-size: 12px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-            QCalendarWidget QTableView QAbstractItemView:enabled #qt_calendar_daywidget[today="true"] {
-                color: #1976d2;
-                font-weight: bold;
-                background-color: #e3f2fd;
-                border-radius: 4px;
-            }
-            QCalendarWidget QTableView QAbstractItemView:enabled #qt_calendar_daywidget[selected="true"] {
-                color: white;
-                font-weight: bold;
-                background-color: #1976d2;
-                border-radius: 4px;
-            }
-            QCalendarWidget QTableView QAbstractItemView:enabled #qt_calendar_daywidget[weekend="true"] {
-                color: #e57373;
-            }
-        """)
+        self.date_input.calendarWidget().setStyleSheet(_CALENDAR_QSS)
         metadata_layout.addWidget(self.create_form_group("发布日期", self.date_input))
 
         # 描述
@@ -1217,6 +1833,7 @@ class BlogEditor(QMainWindow):
 
         self.tags_list = QListWidget()
         self.tags_list.setMaximumHeight(100)
+        self._tag_set = set()  # 与标签列表同步，用于快速判断标签是否重复
         
         tag_input_layout = QHBoxLayout()
         self.tag_input = QLineEdit()
@@ -1248,7 +1865,7 @@ class BlogEditor(QMainWindow):
         image_layout.setContentsMargins(0, 0, 0, 0)
 
         self.image_path_label = QLabel("未选择图片")
-        self.image_path_label.setStyleSheet("color: #666;")
+        self.image_path_label.setObjectName("imagePathLabel")
         select_image_btn = QPushButton("选择图片")
         select_image_btn.clicked.connect(self.select_image)
         
@@ -1265,7 +1882,8 @@ class BlogEditor(QMainWindow):
         color_preview_layout = QHBoxLayout()
         self.color_preview = QLabel()
         self.color_preview.setFixedSize(30, 30)
-        self.color_preview.setStyleSheet("background-color: #FFFFFF; border: 1px solid #ddd; border-radius: 4px;")
+        self._preview_color = None  # 颜色预览块当前显示的颜色
+        self._set_preview_color("#FFFFFF")
         color_preview_layout.addWidget(self.color_preview)
         color_preview_layout.addStretch()
 
@@ -1344,7 +1962,12 @@ class BlogEditor(QMainWindow):
         self.content_input = MarkdownEditor()
         self.content_input.setObjectName("contentEdit")
         self.content_input.setPlaceholderText("在这里输入 Markdown 格式的博客内容...\n支持拖放图片")
-        self.content_input.textChanged.connect(self.update_preview)
+        # 预览防抖：连续输入时只在停顿 150 毫秒后渲染一次
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self.update_preview)
+        self.content_input.textChanged.connect(self._preview_timer.start)
         
         # 修复工具栏显示
         editor_layout.addWidget(editor_label)
@@ -1361,6 +1984,8 @@ class BlogEditor(QMainWindow):
         self.preview_widget = QTextBrowser()
         self.preview_widget.setObjectName("preview")
         self.preview_widget.setOpenExternalLinks(True)
+        # 预览隐藏期间跳过渲染，重新显示时再补上
+        self.preview_widget.installEventFilter(self)
         
         preview_layout.addWidget(preview_label)
         preview_layout.addWidget(self.preview_widget)
@@ -1395,32 +2020,7 @@ class BlogEditor(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                self.content_input.setPlainText(content)
-                self.title_input.setText(metadata.get("title", ""))
-                self.desc_input.setText(metadata.get("description", ""))
-                self.folder_input.setText(metadata.get("folder", ""))
-                
-                if metadata.get("date"):
-                    self.date_input.setDate(QDate.fromString(metadata["date"], "yyyy-MM-dd"))
-                
-                self.tags_list.clear()
-                for tag in metadata.get("tags", []):
-                    self.tags_list.addItem(tag)
-                
-                if metadata.get("language"):
-                    index = 0 if metadata["language"] == "中文" else 1
-                    self.lang_select.setCurrentIndex(index)
-                
-                if metadata.get("color"):
-                    self.current_color = metadata["color"]
-                    self.color_preview.setStyleSheet(
-                        f"background-color: {self.current_color}; border: 1px solid #ddd; border-radius: 4px;"
-                    )
-                
-                if metadata.get("image_path"):
-                    self.image_path = metadata["image_path"]
-                    self.image_path_label.setText(os.path.basename(self.image_path))
-                    self.image_path_label.setStyleSheet("color: #2ecc71;")
+                self._restore_content(content, metadata)
 
     def create_form_group(self, label_text, widget):
         """创建表单组"""
@@ -1443,7 +2043,8 @@ class BlogEditor(QMainWindow):
 
     def add_tag(self):
         tag = self.tag_input.text().strip()
-        if tag and not self.tags_list.findItems(tag, Qt.MatchFlag.MatchExactly):
+        if tag and tag not in self._tag_set:
+            self._tag_set.add(tag)
             self.tags_list.addItem(tag)
             self.tag_input.clear()
             
@@ -1451,6 +2052,16 @@ class BlogEditor(QMainWindow):
         current_item = self.tags_list.currentItem()
         if current_item:
             self.tags_list.takeItem(self.tags_list.row(current_item))
+            self._tag_set.discard(current_item.text())
+            
+    def set_tags(self, tags):
+        """用给定的标签替换当前所有标签，重复的标签只保留一个"""
+        self.tags_list.clear()
+        self._tag_set.clear()
+        for tag in tags:
+            if tag not in self._tag_set:
+                self._tag_set.add(tag)
+                self.tags_list.addItem(tag)
             
     def select_image(self):
         file_name, _ = QFileDialog.getOpenFileName(
@@ -1462,7 +2073,7 @@ class BlogEditor(QMainWindow):
         if file_name:
             self.image_path = file_name
             self.image_path_label.setText(os.path.basename(file_name))
-            self.image_path_label.setStyleSheet("color: #2ecc71;")
+            self._mark_image_selected()
             # 预览封面图片
             preview_html = f'<img src="file:///{file_name.replace(os.sep, "/")}" style="max-width: 200px; height: auto; margin-top: 10px; border-radius: 4px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">'
             self.image_path_label.setText(f"{os.path.basename(file_name)}\n")
@@ -1558,7 +2169,24 @@ class BlogEditor(QMainWindow):
         
         if color_dialog.exec() == QColorDialog.Accepted:
             self.current_color = color_dialog.selectedColor().name()
-            self.color_preview.setStyleSheet(f"background-color: {self.current_color}; border: 1px solid #ddd; border-radius: 4px;")
+            self._set_preview_color(self.current_color)
+            
+    def _set_preview_color(self, color):
+        """更新颜色预览块的背景色"""
+        # 颜色未变化时不重新设置样式表，避免重新解析和应用样式
+        if color == self._preview_color:
+            return
+        self._preview_color = color
+        self.color_preview.setStyleSheet(_COLOR_PREVIEW_QSS.format(color=color))
+    
+    def _mark_image_selected(self):
+        """将封面图片标签切换为已选择的样式"""
+        label = self.image_path_label
+        if not label.property("selected"):
+            label.setProperty("selected", True)
+            # 动态属性变化后需要重新应用样式
+            label.style().unpolish(label)
+            label.style().polish(label)
             
     def select_save_path(self):
         """选择博客保存路径"""
@@ -1583,79 +2211,103 @@ class BlogEditor(QMainWindow):
             self.folder_input.setFocus()
             return
             
+        # 一次性读取所有控件的值，后面只使用局部变量
+        content = self.content_input.toPlainText()
+        title = self.title_input.text()
+        description = self.desc_input.toPlainText()
+        publish_date = self.date_input.date().toPython()
+        language = self.lang_select.currentText()
+        image_path = self.image_path
+        
         # 收集所有标签
-        tags = []
-        for i in range(self.tags_list.count()):
-            tags.append(self.tags_list.item(i).text())
+        tags_list = self.tags_list
+        tags = [tags_list.item(i).text() for i in range(tags_list.count())]
             
         # 构建frontmatter
         frontmatter = {
-            "title": self.title_input.text(),
-            "publishDate": self.date_input.date().toString("yyyy-MM-dd"),
-            "description": self.desc_input.toPlainText(),
+            "title": title,
+            "publishDate": publish_date,
+            "description": description,
             "tags": tags,
-            "language": "中文" if self.lang_select.currentText() == "中文" else "English",
+            "language": "中文" if language == "中文" else "English",
             "heroImage": {
-                "src": f"./{os.path.basename(self.image_path)}" if self.image_path else "",
+                "src": "",  # 复制封面图片后填入
                 "color": self.current_color
             }
         }
         
+        article_folder = os.path.join(self.save_path, folder_name)
         try:
-            # 创建文章专属文件夹
-            article_folder = os.path.join(self.save_path, folder_name)
+            # 创建文章专属文件夹（每次保存都检查，目录可能已被外部删除）
             os.makedirs(article_folder, exist_ok=True)
             
             # 处理文章中的图片
-            content = self.content_input.toPlainText()
+            # 源图片的规范化绝对路径 -> 文章目录中的文件名，重复引用的图片只复制一次
+            copied = {}
+            used_names = set()
             
-            # 查找所有图片引用
-            import re
-            image_pattern = r'!\[.*?\]\((.*?)\)'
-            image_paths = re.findall(image_pattern, content)
+            def copy_image(src):
+                """复制图片到文章目录，返回目标文件名；不同图片的文件名相同时自动编号"""
+                key = os.path.normcase(os.path.abspath(src))
+                name = copied.get(key)
+                if name is None:
+                    stem, ext = os.path.splitext(os.path.basename(src))
+                    name = stem + ext
+                    n = 1
+                    while name in used_names:
+                        name = f"{stem}_{n}{ext}"
+                        n += 1
+                    shutil.copyfile(src, os.path.join(article_folder, name))
+                    copied[key] = name
+                    used_names.add(name)
+                return name
             
-            # 复制所有图片到文章目录并更新引用
-            for img_path in image_paths:
+            # 复制图片到文章目录并更新引用
+            def rewrite_image(match):
+                img_path = match.group(1)
                 if img_path.startswith(('http://', 'https://')):
-                    continue  # 跳过网络图片
+                    return match.group(0)  # 跳过网络图片
                     
-                # 获取图片文件名
-                img_filename = os.path.basename(img_path)
-                # 复制图片到文章目录
-                target_path = os.path.join(article_folder, img_filename)
                 try:
-                    shutil.copy2(img_path, target_path)
-                    # 更新内容中的图片路径为相对路径
-                    content = content.replace(img_path, f"./{img_filename}")
-                except:
-                    pass  # 如果复制失败，保持原路径
+                    img_filename = copy_image(img_path)
+                except OSError:
+                    return match.group(0)  # 如果复制失败，保持原路径
+                # 只替换这一处引用中的路径为相对路径
+                prefix = match.group(0)[:match.start(1) - match.start(0)]
+                return f"{prefix}./{img_filename})"
             
-            # 保存markdown文件
-            md_content = "---\n"
-            md_content += f"title: '{frontmatter['title']}'\n"
-            md_content += f"publishDate: {frontmatter['publishDate']}\n"
-            md_content += f"description: '{frontmatter['description']}'\n"
-            md_content += "tags:\n"
-            for tag in frontmatter['tags']:
-                md_content += f"  - {tag}\n"
-            md_content += f"language: '{frontmatter['language']}'\n"
+            # 一次扫描完成所有图片引用的替换
+            content = _IMG_RE.sub(rewrite_image, content)
             
-            # 如果有封面图片，更新图片路径为相对路径
-            if self.image_path:
-                image_filename = os.path.basename(self.image_path)
-                frontmatter['heroImage']['src'] = f"./{image_filename}"
-                # 复制封面图片到文章文件夹
-                target_path = os.path.join(article_folder, image_filename)
-                shutil.copy2(self.image_path, target_path)
+            # 如果有封面图片，复制到文章文件夹（正文中已引用过的不再重复复制）
+            if image_path:
+                frontmatter["heroImage"]["src"] = f"./{copy_image(image_path)}"
             
-            md_content += f"heroImage: {{ src: '{frontmatter['heroImage']['src']}', color: '{frontmatter['heroImage']['color']}' }}\n"
-            md_content += "---\n\n"
-            md_content += content
+            # 由 YAML 库生成 frontmatter，标题、描述中的引号等特殊字符会被正确转义
+            yaml, _, dumper = _yaml_backend()
+            parts = [
+                "---\n",
+                yaml.dump(frontmatter, Dumper=dumper, sort_keys=False,
+                          allow_unicode=True, default_flow_style=False),
+                "---\n\n",
+                content,
+            ]
             
             # 保存markdown文件到文章文件夹
+            # 先写入临时文件再替换，保存中途出错不会破坏已有的文章
             file_path = os.path.join(article_folder, "index.md")
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
+            tmp_path = file_path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.writelines(parts)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                # 写入或替换失败时删除临时文件，不在文章目录中留下残留
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
                 
             self.statusBar().showMessage(f"博客保存成功！保存位置：{article_folder}", 3000)
             self.statusBar().setStyleSheet("background-color: #2ecc71; color: white; padding: 8px;")
@@ -1665,176 +2317,67 @@ class BlogEditor(QMainWindow):
 
     def update_preview(self):
         """更新 Markdown 预览"""
-        md_text = self.content_input.toPlainText()
+        # 直接调用时取消尚未触发的防抖渲染，避免同一内容再渲染一次
+        self._preview_timer.stop()
         
-        # 处理图片路径
-        def path_to_url(md):
-            import re
-            def replace_path(match):
-                alt = match.group(1)
-                path = match.group(2)
-                if path.startswith(('http://', 'https://', 'file:///')):
-                    return f'![{alt}]({path})'
-                
-                # 处理相对路径
-                if path.startswith('./') or path.startswith('../'):
-                    base_path = os.path.dirname(self.save_path)
-                    abs_path = os.path.abspath(os.path.join(base_path, path))
-                else:
-                    # 处理本地路径
-                    abs_path = os.path.abspath(path)
-                
-                # 转换为 file:/// URL
-                url_path = 'file:///' + abs_path.replace(os.sep, '/')
-                return f'![{alt}]({url_path})'
-            
-            # 匹配 Markdown 图片语法
-            pattern = r'!\[(.*?)\]\((.*?)\)'
-            return re.sub(pattern, replace_path, md)
+        # 预览不可见时只做标记，等重新显示后再渲染
+        if not self.preview_widget.isVisible():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
         
+        md_text = self.content_input.toPlainText()
+        
+        # 内容和保存路径都未变化时（如撤销/重做）直接复用渲染结果
+        key = hash((md_text, self.save_path))
+        styled_html = self._preview_cache.get(key)
+        if styled_html is None:
+            styled_html = self._render_preview(md_text)
+            self._preview_cache[key] = styled_html
+            if len(self._preview_cache) > self._PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+        else:
+            self._preview_cache.move_to_end(key)
+        
+        # 设置 QTextBrowser 的基础路径为保存路径（仅在路径变化时重新设置）
+        if self.save_path != self._preview_search_path:
+            self.preview_widget.setSearchPaths([self.save_path])
+            self._preview_search_path = self.save_path
+        # setHtml 会重建整个文档并回到顶部，记录滚动位置后恢复
+        scroll_bar = self.preview_widget.verticalScrollBar()
+        scroll_pos = scroll_bar.value()
+        self.preview_widget.setHtml(styled_html)
+        scroll_bar.setValue(scroll_pos)
+
+    @staticmethod
+    def _replace_image_path(base_path, match):
+        """将图片引用中的本地路径转换为 file:/// URL"""
+        return f'![{match.group(1)}]({_image_url(base_path, match.group(2))})'
+
+    def path_to_url(self, md):
+        """处理 Markdown 中的图片路径"""
+        if '![' not in md:
+            return md  # 没有图片引用时不必执行正则替换
+        # 相对路径的基准目录每次渲染只计算一次（已是绝对路径，拼接后只需 normpath）
+        base_path = os.path.abspath(os.path.dirname(self.save_path))
+        return self._PREVIEW_IMG_RE.sub(partial(self._replace_image_path, base_path), md)
+
+    def _render_preview(self, md_text):
+        """将 Markdown 渲染为带样式的完整 HTML"""
         # 处理图片路径
-        md_text = path_to_url(md_text)
+        md_text = self.path_to_url(md_text)
         
         # 渲染 Markdown
-        html = markdown.markdown(
-            md_text,
-            extensions=[
-                'markdown.extensions.extra',
-                'markdown.extensions.codehilite',
-                'markdown.extensions.tables',
-                'markdown.extensions.toc',
-                'markdown.extensions.fenced_code',
-                'markdown.extensions.nl2br'
-            ]
-        )
+        html = _render_markdown(md_text, self.config_manager.get('use_markdown_it', False))
         
         # 添加基本样式
-        styled_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-        <meta charset="utf-8">
-        <style>
-            body {{
-                font-family: "Microsoft YaHei", Arial, sans-serif;
-                line-height: 1.6;
-                color: #2c3e50;
-                max-width: 100%;
-                padding: 20px 40px;
-                margin: 0;
-                box-sizing: border-box;
-            }}
-            h1, h2, h3, h4, h5, h6 {{
-                color: #34495e;
-                margin-top: 24px;
-                margin-bottom: 16px;
-                line-height: 1.25;
-            }}
-            h1 {{ font-size: 2em; border-bottom: 1px solid #eee; padding-bottom: .3em; }}
-            h2 {{ font-size: 1.5em; border-bottom: 1px solid #eee; padding-bottom: .3em; }}
-            p {{ margin: 16px 0; line-height: 1.8; }}
-            img {{
-                max-width: 600px;  /* 设置固定的最大宽度 */
-                max-height: 400px;  /* 设置固定的最大高度 */
-                width: auto;  /* 保持宽高比 */
-                height: auto;  /* 保持宽高比 */
-                object-fit: contain;  /* 确保图片完整显示 */
-                border-radius: 4px;
-                margin: 20px auto;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                display: block;
-            }}
-            code {{
-                background-color: #f8f9fa;
-                padding: 2px 4px;
-                border-radius: 3px;
-                font-family: Consolas, monospace;
-                font-size: 0.9em;
-                color: #e83e8c;
-            }}
-            pre {{
-                background-color: #f8f9fa;
-                padding: 16px;
-                border-radius: 4px;
-                overflow-x: auto;
-                line-height: 1.45;
-                border: 1px solid #e1e4e8;
-            }}
-            pre code {{
-                background-color: transparent;
-                padding: 0;
-                color: #24292e;
-                white-space: pre;
-            }}
-            blockquote {{
-                padding: 0.5em 1em;
-                color: #6a737d;
-                border-left: 0.25em solid #dfe2e5;
-                margin: 16px 0;
-                background-color: #f6f8fa;
-            }}
-            table {{
-                border-collapse: collapse;
-                width: 100%;
-                margin: 16px 0;
-                display: block;
-                overflow-x: auto;
-            }}
-            table th, table td {{
-                border: 1px solid #dfe2e5;
-                padding: 8px 13px;
-            }}
-            table th {{
-                background-color: #f6f8fa;
-                font-weight: 600;
-            }}
-            table tr:nth-child(2n) {{
-                background-color: #f8f9fa;
-            }}
-            a {{
-                color: #0366d6;
-                text-decoration: none;
-            }}
-            a:hover {{
-                text-decoration: underline;
-                color: #0056b3;
-            }}
-            ul, ol {{
-                padding-left: 2em;
-                margin: 16px 0;
-            }}
-            li {{
-                margin: 4px 0;
-            }}
-            hr {{
-                height: 1px;
-                background-color: #e1e4e8;
-                border: none;
-                margin: 24px 0;
-            }}
-            kbd {{
-                background-color: #fafbfc;
-                border: 1px solid #d1d5da;
-                border-bottom-color: #c6cbd1;
-                border-radius: 3px;
-                box-shadow: inset 0 -1px 0 #c6cbd1;
-                color: #444d56;
-                display: inline-block;
-                font-size: 0.9em;
-                line-height: 1;
-                padding: 3px 5px;
-            }}
-        </style>
-        </head>
-        <body>
-        {html}
-        </body>
-        </html>
-        """
-        
-        # 设置 QTextBrowser 的基础路径为保存路径
-        self.preview_widget.setSearchPaths([self.save_path])
-        self.preview_widget.setHtml(styled_html)
+        return _PREVIEW_HTML_PREFIX + html + _PREVIEW_HTML_SUFFIX
+
+    def eventFilter(self, obj, event):
+        """预览控件重新显示时，补上隐藏期间跳过的渲染"""
+        if obj is self.preview_widget and event.type() == QEvent.Show and self._preview_dirty:
+            self._preview_timer.start()
+        return super().eventFilter(obj, event)
 
     def update_metadata(self, metadata):
         """更新元数据表单"""
@@ -1852,9 +2395,7 @@ class BlogEditor(QMainWindow):
                 pass
         
         if 'tags' in metadata and isinstance(metadata['tags'], list):
-            self.tags_list.clear()
-            for tag in metadata['tags']:
-                self.tags_list.addItem(str(tag))
+            self.set_tags(map(str, metadata['tags']))
         
         if 'language' in metadata:
             lang = metadata['language']
@@ -1866,9 +2407,7 @@ class BlogEditor(QMainWindow):
                 if 'color' in metadata['heroImage']:
                     color = metadata['heroImage']['color']
                     self.current_color = color
-                    self.color_preview.setStyleSheet(
-                        f"background-color: {color}; border: 1px solid #ddd; border-radius: 4px;"
-                    )
+                    self._set_preview_color(color)
         
         self.statusBar().showMessage("元数据更新成功！", 3000)
         self.statusBar().setStyleSheet("background-color: #2ecc71; color: white; padding: 8px;")
@@ -1895,22 +2434,51 @@ class BlogEditor(QMainWindow):
         except Exception as e:
             print(f"保存配置文件失败: {str(e)}")
 
+    def _clean_stale_temp_files(self, max_age_days=7):
+        """删除临时目录中超过指定天数未修改的文件和文件夹"""
+        cutoff = datetime.now().timestamp() - max_age_days * 86400
+        try:
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.remove(entry.path)
+                    except OSError:
+                        pass  # 文件可能正被其他实例使用
+        except Exception as e:
+            print(f"清理临时文件失败: {str(e)}")
+
     def closeEvent(self, event):
         """程序关闭时保存配置"""
         self.save_config()  # 保存配置
+        self.config_manager.flush_if_dirty()  # 同步写入尚未保存的配置
         self.content_input.cleanup()
         self.auto_saver.cleanup()
-        self.content_input.text_cache.cleanup()
+        self.error_handler.shutdown()
         super().closeEvent(event)
 
     @handle_errors()
     def _setup_auto_save(self):
         """设置自动保存"""
+        self._last_autosave_hash = None  # 上一次自动保存的内容和元数据的哈希值
+        # 自动保存时复用的元数据缓冲区（标签单独存放）
+        self._autosave_buf = dict.fromkeys(
+            ("title", "description", "folder", "date", "language", "color", "image_path"), "")
+        self._autosave_tags = []
         self.auto_save_timer = QTimer(self)
         self.auto_save_timer.timeout.connect(self._auto_save)
         interval = self.config_manager.get('auto_save_interval', 60) * 1000  # 转换为毫秒
         self.auto_save_timer.start(interval)
         
+    def _on_autosave_flushed(self, digest, success):
+        """配置写入完成（在后台保存线程中调用，只修改普通属性）"""
+        if success:
+            self._last_autosave_hash = digest
+
     @handle_errors()
     def _try_restore_auto_save(self):
         """尝试恢复自动保存的内容"""
@@ -1930,36 +2498,43 @@ class BlogEditor(QMainWindow):
 
     @handle_errors()
     def _restore_content(self, content: str, metadata: dict):
-        """恢复内容和元数据"""
-        if content:
-            self.content_input.setPlainText(content)
-            
-        if metadata:
-            self.title_input.setText(metadata.get("title", ""))
-            self.desc_input.setText(metadata.get("description", ""))
-            self.folder_input.setText(metadata.get("folder", ""))
-            
-            if metadata.get("date"):
-                self.date_input.setDate(QDate.fromString(metadata["date"], "yyyy-MM-dd"))
-            
-            self.tags_list.clear()
-            for tag in metadata.get("tags", []):
-                self.tags_list.addItem(tag)
-            
-            if metadata.get("language"):
-                index = 0 if metadata["language"] == "中文" else 1
-                self.lang_select.setCurrentIndex(index)
-            
-            if metadata.get("color"):
-                self.current_color = metadata["color"]
-                self.color_preview.setStyleSheet(
-                    f"background-color: {self.current_color}; border: 1px solid #ddd; border-radius: 4px;"
-                )
-            
-            if metadata.get("image_path"):
-                self.image_path = metadata["image_path"]
-                self.image_path_label.setText(os.path.basename(self.image_path))
-                self.image_path_label.setStyleSheet("color: #2ecc71;")
+        """恢复内容和元数据（两种自动保存的恢复都经过这里）"""
+        # 批量填充表单时屏蔽信号，避免每个控件的变化都触发一次预览渲染
+        widgets = [self.content_input, self.title_input, self.desc_input,
+                   self.folder_input, self.date_input, self.tags_list, self.lang_select]
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            if content:
+                self.content_input.setPlainText(content)
+                
+            if metadata:
+                self.title_input.setText(metadata.get("title", ""))
+                self.desc_input.setText(metadata.get("description", ""))
+                self.folder_input.setText(metadata.get("folder", ""))
+                
+                if metadata.get("date"):
+                    self.date_input.setDate(QDate.fromString(metadata["date"], "yyyy-MM-dd"))
+                
+                self.set_tags(metadata.get("tags", []))
+                
+                if metadata.get("language"):
+                    index = 0 if metadata["language"] == "中文" else 1
+                    self.lang_select.setCurrentIndex(index)
+                
+                if metadata.get("color"):
+                    self.current_color = metadata["color"]
+                    self._set_preview_color(self.current_color)
+                
+                if metadata.get("image_path"):
+                    self.image_path = metadata["image_path"]
+                    self.image_path_label.setText(os.path.basename(self.image_path))
+                    self._mark_image_selected()
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        # 信号被屏蔽，填充完成后统一渲染一次预览
+        self.update_preview()
 
     @handle_errors()
     def _auto_save(self) -> None:
@@ -1968,23 +2543,31 @@ class BlogEditor(QMainWindow):
             # 获取当前内容
             current_content = self.content_input.toPlainText()
             
-            # 收集当前元数据
-            current_metadata = {
-                "title": self.title_input.text(),
-                "description": self.desc_input.toPlainText(),
-                "folder": self.folder_input.text(),
-                "date": self.date_input.date().toString("yyyy-MM-dd"),
-                "tags": [self.tags_list.item(i).text() 
-                        for i in range(self.tags_list.count())],
-                "language": self.lang_select.currentText(),
-                "color": self.current_color,
-                "image_path": getattr(self, 'image_path', '')
-            }
+            # 收集当前元数据（写入复用的缓冲区，没有变化的周期不创建新对象）
+            buf = self._autosave_buf
+            buf["title"] = self.title_input.text()
+            buf["description"] = self.desc_input.toPlainText()
+            buf["folder"] = self.folder_input.text()
+            buf["date"] = self.date_input.date().toString("yyyy-MM-dd")
+            buf["language"] = self.lang_select.currentText()
+            buf["color"] = self.current_color
+            buf["image_path"] = getattr(self, 'image_path', '')
+            tags = self._autosave_tags
+            tags.clear()
+            tags.extend(self.tags_list.item(i).text() for i in range(self.tags_list.count()))
             
-            # 保存到配置
+            # 内容和元数据都没有变化时不重写配置文件
+            digest = hash((current_content, tuple(tags), *buf.values()))
+            if digest == self._last_autosave_hash:
+                return
+            
+            # 交给配置的是独立的副本，后台线程序列化时缓冲区可以继续复用
+            current_metadata = dict(buf, tags=list(tags))
+            
+            # 保存到配置（配置文件由后台线程写入，写入成功后才记录哈希值，失败时下次继续尝试）
             self.config_manager.set('auto_save_content', current_content)
             self.config_manager.set('auto_save_metadata', current_metadata)
-            self.config_manager.save_config()
+            self.config_manager.flush_async(partial(self._on_autosave_flushed, digest))
             
             # 更新状态栏
             self.statusBar().showMessage("已自动保存", 2000)
@@ -1,6 +1,25 @@
 import os
 import json
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Callable, List
+
+try:
+    # 可选依赖 orjson：比标准库 json 更快，直接读写字节
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj: Any) -> bytes:
+    """将对象序列化为 UTF-8 编码的 JSON 字节"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _json_loads(data: bytes) -> Any:
+    """从 JSON 字节反序列化对象"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class ConfigManager:
     """配置管理类，处理应用程序的配置保存和加载"""
@@ -14,6 +33,14 @@ class ConfigManager:
         """
         self.config_file = config_file
         self.config: Dict[str, Any] = self._load_config()
+        self._dirty = False  # 是否有尚未写入文件的修改
+        self._lock = threading.Lock()  # 保护配置字典，后台线程序列化时不能被修改
+        self._write_lock = threading.RLock()  # 同一时间只有一个线程写入配置文件
+        # 后台保存线程只创建一次，flush_async 只是唤醒它
+        self._flush_condition = threading.Condition()
+        self._flush_requested = False
+        self._flush_callbacks: List[Callable[[bool], None]] = []
+        self._flush_thread: Optional[threading.Thread] = None
         
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -32,12 +59,14 @@ class ConfigManager:
             'image_max_width': 800,    # 图片最大宽度
             'image_quality': 85,       # 图片压缩质量
             'recent_files': [],        # 最近打开的文件列表
+            'use_markdown_it': False,  # 使用 markdown-it-py 渲染预览（更快，但不支持目录、代码高亮等扩展）
         }
         
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                    loaded_config = _json_loads(data)
                     # 合并默认配置和加载的配置
                     default_config.update(loaded_config)
         except Exception as e:
@@ -53,13 +82,65 @@ class ConfigManager:
             bool: 保存是否成功
         """
         try:
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            with self._write_lock:
+                with self._lock:
+                    data = _json_dumps(self.config)
+                    self._dirty = False
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                # 先写入临时文件再替换，写入中途出错不会破坏原配置文件
+                tmp_file = self.config_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.config_file)
             return True
         except Exception as e:
+            self._dirty = True
             print(f"保存配置文件失败: {str(e)}")
             return False
+            
+    def flush_if_dirty(self) -> bool:
+        """
+        仅在配置有修改时保存到文件
+        
+        Returns:
+            bool: 保存是否成功（没有修改时返回 True）
+        """
+        # 先获取写入锁：后台线程正在写入时等待其完成，再根据修改标记决定是否需要写入
+        with self._write_lock:
+            if not self._dirty:
+                return True
+            return self.save_config()
+        
+    def flush_async(self, callback: Optional[Callable[[bool], None]] = None) -> None:
+        """
+        在后台线程中保存有修改的配置，调用方立即返回
+        
+        Args:
+            callback: 保存完成后在后台线程中调用，参数为保存是否成功
+        """
+        with self._flush_condition:
+            if callback is not None:
+                self._flush_callbacks.append(callback)
+            self._flush_requested = True
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(target=self._flush_worker, daemon=True)
+                self._flush_thread.start()
+            self._flush_condition.notify()
+            
+    def _flush_worker(self) -> None:
+        """后台保存线程：等待保存请求，多次请求合并为一次写入"""
+        while True:
+            with self._flush_condition:
+                while not self._flush_requested:
+                    self._flush_condition.wait()
+                self._flush_requested = False
+                callbacks, self._flush_callbacks = self._flush_callbacks, []
+            success = self.flush_if_dirty()
+            for callback in callbacks:
+                try:
+                    callback(success)
+                except Exception as e:
+                    print(f"配置保存回调执行失败: {str(e)}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -82,7 +163,9 @@ class ConfigManager:
             key: 配置键
             value: 配置值
         """
-        self.config[key] = value
+        with self._lock:
+            self.config[key] = value
+            self._dirty = True
         
     def add_recent_file(self, file_path: str) -> None:
         """
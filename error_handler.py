@@ -1,7 +1,9 @@
 from typing import Optional, Callable
 from PySide6.QtWidgets import QMessageBox
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import traceback
 from datetime import datetime
@@ -42,12 +44,26 @@ class ErrorHandler:
         log_dir = os.path.dirname(self.log_file)
         os.makedirs(log_dir, exist_ok=True)
         
-        logging.basicConfig(
-            filename=self.log_file,
-            level=logging.ERROR,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        # 调用线程只把日志放入队列，由监听线程写入文件，避免磁盘 IO 阻塞界面
+        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        ))
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        
+        root_logger = logging.getLogger()
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(self._queue_handler)
+        root_logger.setLevel(logging.ERROR)
+        
+    def shutdown(self) -> None:
+        """移除队列日志处理器并停止日志监听线程，写入队列中剩余的日志"""
+        # 先移除处理器，之后的日志不会再进入已无人消费的队列
+        logging.getLogger().removeHandler(self._queue_handler)
+        self._log_listener.stop()
         
     def handle_error(self, error: Exception, show_dialog: bool = True,
                     callback: Optional[Callable] = None) -> None:
@@ -1,9 +1,77 @@
 import os
+import re
 import shutil
-import yaml
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Tuple, Optional
 from error_handler import FileOperationError, handle_errors
 
+@lru_cache(maxsize=None)
+def _yaml_backend():
+    """
+    首次使用时才导入 yaml，加快程序启动
+    
+    Returns:
+        (yaml 模块, Loader, Dumper)，优先使用 libyaml 的 C 实现
+    """
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml, loader, dumper
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    复制文件内容并保留修改时间
+    
+    优先使用 os.copy_file_range 在内核中复制（支持的文件系统上可直接共享数据块），
+    不可用时回退到 shutil.copyfile（Linux 上使用 sendfile）
+    
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+    """
+    # 图片已经在目标位置（重新保存同一篇文章）时不需要复制，
+    # 否则以写入方式打开目标文件会先清空源文件
+    try:
+        if os.path.samefile(src, dst):
+            return
+    except FileNotFoundError:
+        pass
+    
+    st = os.stat(src)
+    # 先写入临时文件再替换，复制中途失败不会留下不完整的目标文件；
+    # 临时文件名唯一，并发复制到同一目录时互不干扰
+    fd, tmp_dst = tempfile.mkstemp(prefix=os.path.basename(dst) + '.', suffix='.tmp',
+                                   dir=os.path.dirname(dst) or None)
+    try:
+        copied = False
+        with open(fd, 'wb') as fdst:
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    with open(src, 'rb') as fsrc:
+                        remaining = st.st_size
+                        while remaining > 0:
+                            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                            if n == 0:
+                                break
+                            remaining -= n
+                    copied = remaining == 0
+                except OSError:
+                    pass
+        if not copied:
+            shutil.copyfile(src, tmp_dst)
+        # mkstemp 创建的文件只有属主可读写，改为与源文件相同的权限
+        os.chmod(tmp_dst, st.st_mode & 0o777)
+        os.utime(tmp_dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp_dst, dst)
+    except BaseException:
+        try:
+            os.remove(tmp_dst)
+        except OSError:
+            pass
+        raise
+
 class FileManager:
     """文件管理类，处理所有文件相关操作"""
     
@@ -44,13 +112,36 @@ class FileManager:
             article_folder = os.path.join(save_path, folder_name)
             os.makedirs(article_folder, exist_ok=True)
             
-            # 处理图片
+            # 处理图片：同一源文件只复制一次，不同源文件的目标文件名相同时自动编号，
+            # 保证并发复制时每个目标文件只有一个写入者
+            targets = {}  # 规范化的源文件路径 -> 目标文件名
+            used_names = set()
+            replacements = {}  # 内容中的图片路径 -> 相对路径
             for src_path, dest_name in images.items():
-                if os.path.exists(src_path):
-                    dest_path = os.path.join(article_folder, dest_name)
-                    shutil.copy2(src_path, dest_path)
-                    # 更新内容中的图片路径
-                    content = content.replace(src_path, f"./{dest_name}")
+                if not os.path.exists(src_path):
+                    continue
+                key = os.path.normcase(os.path.abspath(src_path))
+                name = targets.get(key)
+                if name is None:
+                    stem, ext = os.path.splitext(dest_name)
+                    name = dest_name
+                    counter = 1
+                    while name in used_names:
+                        name = f"{stem}_{counter}{ext}"
+                        counter += 1
+                    targets[key] = name
+                    used_names.add(name)
+                replacements[src_path] = f"./{name}"
+            if targets:
+                # 复制受 IO 限制，多张图片并发复制
+                with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+                    list(pool.map(_copy_file, targets,
+                                  [os.path.join(article_folder, name) for name in targets.values()]))
+                # 更新内容中的图片路径：所有路径合并为一个正则，一次扫描完成替换
+                # （较长的路径优先匹配，避免被其前缀路径抢先替换）
+                pattern = re.compile('|'.join(
+                    map(re.escape, sorted(replacements, key=len, reverse=True))))
+                content = pattern.sub(lambda m: replacements[m.group(0)], content)
             
             # 生成frontmatter
             frontmatter = self._generate_frontmatter(metadata)
@@ -91,7 +182,8 @@ class FileManager:
                 # 提取frontmatter
                 _, frontmatter, content = content.split('---', 2)
                 try:
-                    metadata = yaml.safe_load(frontmatter)
+                    yaml, loader, _ = _yaml_backend()
+                    metadata = yaml.load(frontmatter, Loader=loader)
                     return content.strip(), metadata
                 except:
                     # 如果解析frontmatter失败，返回完整内容
@@ -113,7 +205,8 @@ class FileManager:
             str: YAML格式的frontmatter
         """
         try:
-            return yaml.dump(metadata, allow_unicode=True, default_flow_style=False)
+            yaml, _, dumper = _yaml_backend()
+            return yaml.dump(metadata, Dumper=dumper, allow_unicode=True, default_flow_style=False)
         except Exception as e:
             raise FileOperationError(f"生成frontmatter失败: {str(e)}")
             
@@ -1,7 +1,7 @@
 import os
-from datetime import datetime
+import shutil
+import secrets
 from typing import Tuple, Optional
-from PIL import Image
 import io
 from PySide6.QtGui import QImage
 from error_handler import ImageProcessingError, handle_errors
@@ -49,7 +49,7 @@ class ImageProcessor:
             
         try:
             # 生成唯一的临时文件名
-            temp_filename = f"image_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+            temp_filename = f"image_{secrets.token_hex(8)}.png"
             temp_image_path = os.path.join(self.temp_dir, temp_filename)
             
             # 处理图片数据或文件
@@ -59,7 +59,8 @@ class ImageProcessor:
             else:
                 if not os.path.exists(image_path):
                     raise ImageProcessingError(f"图片文件不存在: {image_path}")
-                Image.open(image_path).save(temp_image_path)
+                # 直接复制原文件，由 _optimize_image 统一解码，避免先重新编码为 PNG
+                shutil.copyfile(image_path, temp_image_path)
             
             # 压缩和优化图片
             self._optimize_image(temp_image_path)
@@ -85,17 +86,23 @@ class ImageProcessor:
             max_width = self.config.get('image_max_width', 800)
             quality = self.config.get('image_quality', 85)
             
+            from PIL import Image  # 延迟导入，首次处理图片时才加载 PIL
             img = Image.open(image_path)
             
+            width, height = img.size
+            new_size = None
+            if width > max_width:
+                new_size = (max_width, int(height * max_width / width))
+                # JPEG 在解码时直接按 1/2、1/4、1/8 缩小，大图不必完整解码
+                img.draft('RGB', new_size)
+            
             # 转换为RGB模式（处理PNG等格式）
             if img.mode in ('RGBA', 'P'):
                 img = img.convert('RGB')
             
-            # 调整大小
-            if img.size[0] > max_width:
-                ratio = max_width / img.size[0]
-                new_size = (max_width, int(img.size[1] * ratio))
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
+            # 调整大小：先用整数倍的快速缩小，再用 LANCZOS 完成剩余部分
+            if new_size:
+                img = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
             
             # 保存优化后的图片
             img.save(image_path, 'JPEG', quality=quality, optimize=True)
@@ -128,7 +135,6 @@ class ImageProcessor:
         """清理临时文件"""
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
-                import shutil
                 shutil.rmtree(self.temp_dir)
             except Exception as e:
                 print(f"清理临时文件失败: {str(e)}") 
\ No newline at end of file